@@ -3,11 +3,12 @@ from typing import Annotated, Any
 
 from classy_fastapi.decorators import get, post
 from fastapi import Depends, File, HTTPException, Path, UploadFile
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from neuroglia.dependency_injection import ServiceProviderBase
 from neuroglia.mapping.mapper import Mapper
 from neuroglia.mediation.mediator import Mediator
 from neuroglia.mvc.controller_base import ControllerBase
+from starlette.types import Receive, Scope, Send
 
 from api.dependencies import get_current_user
 from application.commands import (ControlLabCommand, DeleteLabCommand,
@@ -26,6 +27,20 @@ worker_id_annotation = Annotated[str, Path(description="The CML Worker UUID.")]
 lab_id_annotation = Annotated[str, Path(description="The Lab ID.")]
 
 
+class ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse that always closes its async generator body, releasing the upstream connection.
+
+    Starlette does not close the body iterator when the client disconnects or sending fails, so an abandoned
+    lab download would otherwise keep its CML response open until garbage collection.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()  # type: ignore[union-attr]
+
+
 class LabsController(ControllerBase):
     def __init__(self, service_provider: ServiceProviderBase, mapper: Mapper, mediator: Mediator):
         """Handles lab management operations for CML Workers."""
@@ -154,7 +169,7 @@ class LabsController(ControllerBase):
         worker_id: worker_id_annotation,
         lab_id: lab_id_annotation,
         token: str = Depends(get_current_user),
-    ) -> PlainTextResponse:
+    ) -> ClosingStreamingResponse:
         """Download lab topology as YAML.
 
         Returns the lab topology in YAML format suitable for import/backup.
@@ -162,13 +177,15 @@ class LabsController(ControllerBase):
         (**Requires valid token.**)
         """
         logger.info(f"Downloading lab {lab_id} from worker {worker_id}")
-        command = DownloadLabCommand(worker_id=worker_id, lab_id=lab_id)
+        command = DownloadLabCommand(worker_id=worker_id, lab_id=lab_id, stream=True)
         result = await self.mediator.execute_async(command)
 
         if not result.is_success:
             return self.process(result)
 
-        return PlainTextResponse(content=result.data, media_type="text/yaml")
+        # Errors up to the first chunk come back as a failed result above. A failure after that aborts the
+        # response (no terminating chunk), so clients see an incomplete transfer rather than a short 200 body.
+        return ClosingStreamingResponse(content=result.data, media_type="text/yaml")
 
     @post(
         "/region/{aws_region}/workers/{worker_id}/labs/import",
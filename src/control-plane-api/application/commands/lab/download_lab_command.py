@@ -1,6 +1,7 @@
 """Download Lab YAML Command - retrieves lab topology in YAML format."""
 
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
 from dataclasses import dataclass
 
 from neuroglia.core.operation_result import OperationResult
@@ -13,15 +14,43 @@ from integration.services.cml_api_client import CMLApiClientFactory
 log = logging.getLogger(__name__)
 
 
-@dataclass
-class DownloadLabCommand(Command[OperationResult[str]]):
-    """Command to download a lab's topology as YAML."""
+@dataclass(slots=True)
+class DownloadLabCommand(Command[OperationResult[str | AsyncIterator[bytes]]]):
+    """Command to download a lab's topology as YAML.
+
+    With ``stream=True`` the result holds an async iterator of YAML bytes instead of the full string.
+    The caller must consume it fully or ``aclose()`` it, which releases the upstream CML connection.
+    """
 
     worker_id: str
     lab_id: str
+    stream: bool = False
+
+
+class _ResumedLabStream(AsyncIterator[bytes]):
+    """Lab YAML byte stream whose first chunk was already pulled, re-emitted ahead of the rest.
+
+    ``aclose()`` closes the upstream stream even if iteration never started, which a wrapping async generator
+    would not do.
+    """
 
+    def __init__(self, first: bytes, chunks: AsyncGenerator[bytes, None]):
+        self._first = first
+        self._chunks = chunks
 
-class DownloadLabCommandHandler(CommandHandler[DownloadLabCommand, OperationResult[str]]):
+    async def __anext__(self) -> bytes:
+        if self._first:
+            first, self._first = self._first, b""
+            return first
+        return await anext(self._chunks)
+
+    async def aclose(self) -> None:
+        """Release the upstream CML response."""
+        self._first = b""
+        await self._chunks.aclose()
+
+
+class DownloadLabCommandHandler(CommandHandler[DownloadLabCommand, OperationResult[str | AsyncIterator[bytes]]]):
     """Handler for DownloadLabCommand - retrieves lab YAML from CML API."""
 
     def __init__(
@@ -41,7 +70,9 @@ class DownloadLabCommandHandler(CommandHandler[DownloadLabCommand, OperationResu
         self._cml_client_factory = cml_api_client_factory
         self._settings = settings
 
-    async def handle_async(self, request: DownloadLabCommand, cancellation_token=None) -> OperationResult[str]:
+    async def handle_async(
+        self, request: DownloadLabCommand, cancellation_token=None
+    ) -> OperationResult[str | AsyncIterator[bytes]]:
         """Download lab topology as YAML.
 
         Args:
@@ -49,9 +80,9 @@ class DownloadLabCommandHandler(CommandHandler[DownloadLabCommand, OperationResu
             cancellation_token: Optional cancellation token
 
         Returns:
-            OperationResult containing YAML string or error
+            OperationResult containing YAML string (or byte stream) or error
         """
-        log.info(f"Downloading lab {request.lab_id} from worker {request.worker_id}")
+        log.info("Downloading lab %s from worker %s", request.lab_id, request.worker_id)
 
         # Get worker to access CML credentials
         worker = await self._worker_repository.get_by_id_async(request.worker_id)
@@ -66,15 +97,21 @@ class DownloadLabCommandHandler(CommandHandler[DownloadLabCommand, OperationResu
             # Determine endpoint to use (public or private based on settings)
             endpoint = worker.get_effective_endpoint(self._settings.use_private_ip_for_monitoring)
             if endpoint != worker.state.https_endpoint:
-                log.debug(f"Using private IP endpoint for lab download: {endpoint}")
+                log.debug("Using private IP endpoint for lab download: %s", endpoint)
 
             # Create CML API client using factory
             cml_client = self._cml_client_factory.create(base_url=endpoint)
 
+            if request.stream:
+                # Pull the first chunk now so HTTP/auth errors surface before the caller starts responding
+                chunks = cml_client.download_lab_stream(request.lab_id)
+                first = await anext(chunks, b"")
+                return self.ok(_ResumedLabStream(first, chunks))
+
             # Download lab YAML
             yaml_content = await cml_client.download_lab(request.lab_id)
 
-            log.info(f"Successfully downloaded lab {request.lab_id} ({len(yaml_content)} bytes)")
+            log.info("Successfully downloaded lab %s (%d bytes)", request.lab_id, len(yaml_content))
             return self.ok(yaml_content)
 
         except Exception as e:
@@ -1,8 +1,12 @@
 """Deregister CML Worker license command and handler."""
 
+import importlib
+import itertools
 import logging
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from neuroglia.core import OperationResult
 from neuroglia.mediation.mediator import Command, CommandHandler
@@ -10,10 +14,24 @@ from neuroglia.mediation.mediator import Command, CommandHandler
 from application.services.background_scheduler import BackgroundTaskScheduler
 from domain.repositories.cml_worker_repository import CMLWorkerRepository
 
+if TYPE_CHECKING:
+    from application.jobs.license_deregistration_job import LicenseDeregistrationJob
+
 log = logging.getLogger(__name__)
 
+_job_cls: "type[LicenseDeregistrationJob] | None" = None
+_job_counter = itertools.count()
+
+
+def _get_job_cls() -> "type[LicenseDeregistrationJob]":
+    """Resolve LicenseDeregistrationJob on first use (importing it at module load is circular)."""
+    global _job_cls
+    if _job_cls is None:
+        _job_cls = importlib.import_module("application.jobs.license_deregistration_job").LicenseDeregistrationJob
+    return _job_cls
 
-@dataclass
+
+@dataclass(slots=True)
 class DeregisterCMLWorkerLicenseCommand(Command[OperationResult[dict]]):
     """Command to deregister a CML Worker license.
 
@@ -52,14 +70,12 @@ class DeregisterCMLWorkerLicenseCommandHandler(
             return self.not_found("Worker", f"Worker {request.worker_id} not found")
 
         # Schedule background job
-        # Import here to avoid circular import at module load time
-        from application.jobs.license_deregistration_job import LicenseDeregistrationJob
-
-        job_id = f"license_dereg_{request.worker_id}_{int(datetime.now(UTC).timestamp())}"
+        # Counter + monotonic clock keep ids unique even for same-second retries
+        job_id = f"license_dereg_{request.worker_id}_{next(_job_counter)}_{time.monotonic_ns()}"
 
         try:
             # Create and configure job
-            job = LicenseDeregistrationJob(
+            job = _get_job_cls()(
                 worker_id=request.worker_id,
                 initiated_by=request.initiated_by,
             )
@@ -71,7 +87,7 @@ class DeregisterCMLWorkerLicenseCommandHandler(
             # Enqueue via scheduler
             await self._scheduler.enqueue_task_async(job)
 
-            log.info(f"📝 Scheduled license deregistration job for worker {request.worker_id} (job_id: {job_id})")
+            log.info("📝 Scheduled license deregistration job for worker %s (job_id: %s)", request.worker_id, job_id)
 
             return self.accepted(
                 {
@@ -8,6 +8,7 @@ from neuroglia.mediation import Command, CommandHandler
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
+from domain.entities.cml_worker import CMLWorker
 from domain.repositories import CMLWorkerRepository
 
 log = logging.getLogger(__name__)
@@ -64,10 +65,7 @@ class DisableIdleDetectionCommandHandler(CommandHandler[DisableIdleDetectionComm
                 if not worker:
                     log.warning(f"Worker {request.worker_id} not found")
                     span.set_status(Status(StatusCode.ERROR, "Worker not found"))
-                    return self.not_found(
-                        f"Worker {request.worker_id}",
-                        f"Worker {request.worker_id} not found",
-                    )
+                    return self.not_found(CMLWorker, request.worker_id)
 
                 # Check if already disabled
                 if not worker.state.is_idle_detection_enabled:
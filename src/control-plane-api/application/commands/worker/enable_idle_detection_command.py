@@ -8,13 +8,14 @@ from neuroglia.mediation import Command, CommandHandler
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
+from domain.entities.cml_worker import CMLWorker
 from domain.repositories import CMLWorkerRepository
 
 log = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnableIdleDetectionCommand(Command[OperationResult[dict]]):
     """Command to enable idle detection for a CML worker.
 
@@ -54,8 +55,9 @@ class EnableIdleDetectionCommandHandler(CommandHandler[EnableIdleDetectionComman
             OperationResult with idle detection status
         """
         with tracer.start_as_current_span("EnableIdleDetectionCommandHandler.handle_async") as span:
-            span.set_attribute("worker_id", request.worker_id)
-            span.set_attribute("enabled_by", request.enabled_by or "system")
+            if span.is_recording():
+                span.set_attribute("worker_id", request.worker_id)
+                span.set_attribute("enabled_by", request.enabled_by or "system")
 
             try:
                 # Retrieve worker
@@ -64,10 +66,7 @@ class EnableIdleDetectionCommandHandler(CommandHandler[EnableIdleDetectionComman
                 if not worker:
                     log.warning(f"Worker {request.worker_id} not found")
                     span.set_status(Status(StatusCode.ERROR, "Worker not found"))
-                    return self.not_found(
-                        f"Worker {request.worker_id}",
-                        f"Worker {request.worker_id} not found",
-                    )
+                    return self.not_found(CMLWorker, request.worker_id)
 
                 # Check if already enabled
                 if worker.state.is_idle_detection_enabled:
@@ -1,5 +1,7 @@
 """Import existing CML Worker command with handler."""
 
+import asyncio
+import contextlib
 import logging
 from dataclasses import dataclass
 
@@ -22,15 +24,29 @@ from integration.exceptions import (
     IntegrationException,
 )
 from integration.models import CMLWorkerInstanceDto
-from integration.services.aws_ec2_api_client import AwsEc2Client
+from integration.services.aws_ec2_api_client import AmiDetails, AwsEc2Client
 
 from ..command_handler_base import CommandHandlerBase
 
 log = logging.getLogger(__name__)
-tracer = trace.get_tracer(__name__)
 
 
-@dataclass
+async def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a task whose result is no longer needed and wait for it, so a failure it already hit is retrieved.
+
+    Only the discarded task's own cancellation or error is swallowed; a cancellation of the caller propagates.
+    """
+    task.cancel()
+    try:
+        with contextlib.suppress(Exception):
+            await task
+    except asyncio.CancelledError:
+        current_task = asyncio.current_task()
+        if current_task is not None and current_task.cancelling():
+            raise
+
+
+@dataclass(slots=True)
 class ImportCMLWorkerCommand(Command[OperationResult[CMLWorkerInstanceDto]]):
     """Command to import an existing EC2 instance as a CML Worker.
 
@@ -101,7 +117,8 @@ class ImportCMLWorkerCommandHandler(
         if not any([command.aws_instance_id, command.ami_id, command.ami_name]):
             return self.bad_request("Must provide at least one of: aws_instance_id, ami_id, or ami_name")
 
-        # Add tracing context
+        # Add tracing context (stages below are recorded as events on this span rather than child spans)
+        span = trace.get_current_span()
         add_span_attributes(
             {
                 "cml_worker.import.region": command.aws_region,
@@ -112,135 +129,165 @@ class ImportCMLWorkerCommandHandler(
             }
         )
 
+        # Cheap validation failure: report it without going through the generic error path
         try:
-
             aws_region = AwsRegion(command.aws_region)
-            instance = None
+        except ValueError:
+            return self.bad_request(f"Invalid AWS region: {command.aws_region}")
 
-            with tracer.start_as_current_span("discover_ec2_instance") as span:
-                if command.aws_instance_id:
-                    # Direct lookup by instance ID
-                    log.info(f"Looking up EC2 instance by ID: {command.aws_instance_id}")
-                    instance = await self.aws_ec2_client.get_instance_details(
+        try:
+            instance = None
+            # AMI details already fetched while resolving an AMI name, keyed by AMI ID
+            resolved_amis: dict[str, AmiDetails] = {}
+
+            discovery: dict[str, str] = {}
+            if command.aws_instance_id:
+                # Direct lookup by instance ID
+                log.info(f"Looking up EC2 instance by ID: {command.aws_instance_id}")
+                instance = await self.aws_ec2_client.get_instance_details(
+                    aws_region=aws_region,
+                    instance_id=command.aws_instance_id,
+                )
+                discovery["ec2.lookup_method"] = "instance_id"
+            else:
+                # Search by AMI ID or name
+                log.info(f"Searching for EC2 instances by AMI in region {command.aws_region}")
+                filters = {}
+
+                if command.ami_id:
+                    filters["image_ids"] = [command.ami_id]
+                    discovery["ec2.lookup_method"] = "ami_id"
+                    discovery["ec2.ami_id"] = command.ami_id
+                elif command.ami_name:
+                    # Resolve AMI name to AMI IDs first (keeping the details for the selected instance)
+                    log.info(f"Resolving AMI name '{command.ami_name}' to AMI IDs...")
+                    amis = await self.aws_ec2_client.get_amis_by_name(
                         aws_region=aws_region,
-                        instance_id=command.aws_instance_id,
+                        ami_name=command.ami_name,
                     )
-                    span.set_attribute("ec2.lookup_method", "instance_id")
-                else:
-                    # Search by AMI ID or name
-                    log.info(f"Searching for EC2 instances by AMI in region {command.aws_region}")
-                    filters = {}
-
-                    if command.ami_id:
-                        filters["image_ids"] = [command.ami_id]
-                        span.set_attribute("ec2.lookup_method", "ami_id")
-                        span.set_attribute("ec2.ami_id", command.ami_id)
-                    elif command.ami_name:
-                        # Resolve AMI name to AMI IDs first
-                        log.info(f"Resolving AMI name '{command.ami_name}' to AMI IDs...")
-                        ami_ids = await self.aws_ec2_client.get_ami_ids_by_name(
-                            aws_region=aws_region,
-                            ami_name=command.ami_name,
-                        )
-                        if not ami_ids:
-                            error_msg = f"No AMIs found matching name pattern '{command.ami_name}'"
-                            log.error(error_msg)
-                            return self.bad_request(error_msg)
-
-                        filters["image_ids"] = ami_ids
-                        span.set_attribute("ec2.lookup_method", "ami_name")
-                        span.set_attribute("ec2.ami_name", command.ami_name)
-                        span.set_attribute("ec2.resolved_ami_ids", ",".join(ami_ids))
-                        log.info(f"Resolved AMI name to {len(ami_ids)} AMI ID(s): {ami_ids}")
-
-                    instances = await self.aws_ec2_client.list_instances(
-                        region_name=aws_region,
-                        **filters,
-                    )
-
-                    if instances and len(instances) > 0:
-                        instance = instances[0]
-                        log.info(
-                            f"Found {len(instances)} instance(s) matching criteria, "
-                            f"selecting first match: {instance.id}"
-                        )
+                    resolved_amis = {ami.ami_id: ami for ami in amis}
+                    ami_ids = list(resolved_amis)
+                    if not ami_ids:
+                        error_msg = f"No AMIs found matching name pattern '{command.ami_name}'"
+                        log.error(error_msg)
+                        return self.bad_request(error_msg)
+
+                    filters["image_ids"] = ami_ids
+                    discovery["ec2.lookup_method"] = "ami_name"
+                    discovery["ec2.ami_name"] = command.ami_name
+                    discovery["ec2.resolved_ami_ids"] = ",".join(ami_ids)
+                    log.info(f"Resolved AMI name to {len(ami_ids)} AMI ID(s): {ami_ids}")
+
+                instances = await self.aws_ec2_client.list_instances(
+                    region_name=aws_region,
+                    **filters,
+                )
 
-                if not instance:
-                    error_msg = "No matching EC2 instance found"
-                    log.error(f"{error_msg} for criteria: {command}")
-                    return self.bad_request(error_msg)
+                if instances and len(instances) > 0:
+                    instance = instances[0]
+                    log.info(
+                        f"Found {len(instances)} instance(s) matching criteria, "
+                        f"selecting first match: {instance.id}"
+                    )
 
-                span.set_attribute("ec2.instance_id", instance.id)
-                span.set_attribute("ec2.instance_state", instance.state)
-                span.set_attribute("ec2.instance_type", instance.type)
+            if not instance:
+                error_msg = "No matching EC2 instance found"
+                log.error(f"{error_msg} for criteria: {command}")
+                return self.bad_request(error_msg)
+
+            discovery["ec2.instance_id"] = instance.id
+            discovery["ec2.instance_state"] = instance.state
+            discovery["ec2.instance_type"] = instance.type
+            span.add_event("discover_ec2_instance", discovery)
+
+            # Fetch AMI details (unless already retrieved during AMI name resolution) while checking for duplicates
+            ami_details = resolved_amis.get(instance.image_id)
+            ami_details_task: asyncio.Task[AmiDetails | None] | None = None
+            if ami_details is None:
+                ami_details_task = asyncio.create_task(
+                    self.aws_ec2_client.get_ami_details(aws_region=aws_region, ami_id=instance.image_id)
+                )
 
-            with tracer.start_as_current_span("check_duplicate_worker") as span:
-                # Check if instance already imported
+            # Check if instance already imported
+            try:
                 existing_worker = await self.cml_worker_repository.get_by_aws_instance_id_async(instance.id)
-                if existing_worker:
-                    error_msg = (
-                        f"Instance {instance.id} is already registered "
-                        f"as worker '{existing_worker.state.name}' (ID: {existing_worker.id()})"
-                    )
-                    log.warning(error_msg)
-                    span.set_attribute("worker.already_exists", True)
-                    span.set_attribute("worker.existing_id", existing_worker.id())
-                    return self.bad_request(error_msg)
+            except BaseException:
+                if ami_details_task is not None:
+                    await _discard_task(ami_details_task)
+                raise
+
+            if existing_worker:
+                if ami_details_task is not None:
+                    await _discard_task(ami_details_task)
+                error_msg = (
+                    f"Instance {instance.id} is already registered "
+                    f"as worker '{existing_worker.state.name}' (ID: {existing_worker.id()})"
+                )
+                log.warning(error_msg)
+                span.add_event(
+                    "check_duplicate_worker",
+                    {"worker.already_exists": True, "worker.existing_id": existing_worker.id()},
+                )
+                return self.bad_request(error_msg)
 
-                span.set_attribute("worker.already_exists", False)
+            span.add_event("check_duplicate_worker", {"worker.already_exists": False})
 
-            with tracer.start_as_current_span("create_worker_from_import") as span:
-                # Determine worker name (priority: custom name > AWS instance name > generated)
-                worker_name = command.name or instance.name or f"worker-{instance.id}"
+            # Determine worker name (priority: custom name > AWS instance name > generated)
+            worker_name = command.name or instance.name or f"worker-{instance.id}"
 
-                if not command.name and instance.name:
-                    log.info(f"No custom name provided, using AWS instance name: {instance.name}")
-                elif not command.name and not instance.name:
-                    log.info(f"No custom name or AWS instance name, generating: {worker_name}")
+            if not command.name and instance.name:
+                log.info(f"No custom name provided, using AWS instance name: {instance.name}")
+            elif not command.name and not instance.name:
+                log.info(f"No custom name or AWS instance name, generating: {worker_name}")
 
-                # Fetch AMI details from AWS
-                ami_details = await self.aws_ec2_client.get_ami_details(aws_region=aws_region, ami_id=instance.image_id)
-                ami_name = ami_details.ami_name if ami_details else None
-                ami_description = ami_details.ami_description if ami_details else None
-                ami_creation_date = ami_details.ami_creation_date if ami_details else None
+            if ami_details_task is not None:
+                ami_details = await ami_details_task
+            ami_name = ami_details.ami_name if ami_details else None
+            ami_description = ami_details.ami_description if ami_details else None
+            ami_creation_date = ami_details.ami_creation_date if ami_details else None
 
-                if ami_details:
-                    log.info(
-                        f"Retrieved AMI details for import {instance.image_id}: "
-                        f"name={ami_name}, description={ami_description[:50] if ami_description else 'N/A'}..., "
-                        f"created={ami_creation_date}"
-                    )
-                else:
-                    log.warning(f"Failed to retrieve AMI details for {instance.image_id} during import")
-
-                # Create CML Worker aggregate using import factory method
-                worker = CMLWorker.import_from_existing_instance(
-                    name=worker_name,
-                    aws_region=command.aws_region,
-                    aws_instance_id=instance.id,
-                    instance_type=instance.type,
-                    ami_id=instance.image_id,
-                    instance_state=instance.state,
-                    created_by=command.created_by,
-                    ami_name=ami_name,
-                    ami_description=ami_description,
-                    ami_creation_date=ami_creation_date,
-                    public_ip=None,  # Will be populated on next status check
-                    private_ip=None,
+            if ami_details:
+                log.info(
+                    f"Retrieved AMI details for import {instance.image_id}: "
+                    f"name={ami_name}, description={ami_description[:50] if ami_description else 'N/A'}..., "
+                    f"created={ami_creation_date}"
                 )
+            else:
+                log.warning(f"Failed to retrieve AMI details for {instance.image_id} during import")
+
+            # Create CML Worker aggregate using import factory method
+            worker = CMLWorker.import_from_existing_instance(
+                name=worker_name,
+                aws_region=command.aws_region,
+                aws_instance_id=instance.id,
+                instance_type=instance.type,
+                ami_id=instance.image_id,
+                instance_state=instance.state,
+                created_by=command.created_by,
+                ami_name=ami_name,
+                ami_description=ami_description,
+                ami_creation_date=ami_creation_date,
+                public_ip=None,  # Will be populated on next status check
+                private_ip=None,
+            )
 
-                span.set_attribute("cml_worker.id", worker.id())
-                span.set_attribute("cml_worker.name", worker_name)
-                span.set_attribute("cml_worker.status", worker.state.status.value)
+            span.add_event(
+                "create_worker_from_import",
+                {
+                    "cml_worker.id": worker.id(),
+                    "cml_worker.name": worker_name,
+                    "cml_worker.status": worker.state.status.value,
+                },
+            )
 
-            with tracer.start_as_current_span("save_imported_worker") as span:
-                # Save worker (will publish all domain events)
-                saved_worker = await self.cml_worker_repository.add_async(worker)
+            # Save worker (will publish all domain events)
+            saved_worker = await self.cml_worker_repository.add_async(worker)
+            span.add_event("save_imported_worker", {"cml_worker.id": saved_worker.id()})
 
-                log.info(
-                    f"CML Worker imported successfully: id={saved_worker.id()}, "
-                    f"name={worker_name}, aws_instance_id={instance.id}"
-                )
+            log.info(
+                f"CML Worker imported successfully: id={saved_worker.id()}, "
+                f"name={worker_name}, aws_instance_id={instance.id}"
+            )
 
             # Build response DTO
             instance_dto = CMLWorkerInstanceDto(
@@ -278,5 +325,6 @@ class ImportCMLWorkerCommandHandler(
             return self.bad_request(f"Integration error: {str(e)}")
 
         except Exception as e:
-            log.error(f"Unexpected error importing CML Worker: {e}", exc_info=True)
+            # Full tracebacks only at DEBUG so error storms don't pay for traceback formatting
+            log.error(f"Unexpected error importing CML Worker: {e}", exc_info=log.isEnabledFor(logging.DEBUG))
             return self.bad_request(f"Unexpected error: {str(e)}")
@@ -9,18 +9,18 @@ import logging
 from dataclasses import dataclass
 
 from neuroglia.core import OperationResult
-from neuroglia.mediation import Command, CommandHandler, Mediator
+from neuroglia.mediation import Command, CommandHandler
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
-from .stop_cml_worker_command import StopCMLWorkerCommand
+from .stop_cml_worker_command import StopCMLWorkerCommand, StopCMLWorkerCommandHandler
 
 log = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 
-@dataclass
-class PauseWorkerCommand(Command[OperationResult[None]]):
+@dataclass(slots=True)
+class PauseWorkerCommand(Command[OperationResult[bool]]):
     """Command to pause (stop) a CML worker.
 
     DEPRECATED: Use StopCMLWorkerCommand directly.
@@ -36,28 +36,28 @@ class PauseWorkerCommand(Command[OperationResult[None]]):
     reason: str | None = None
 
 
-class PauseWorkerCommandHandler(CommandHandler[PauseWorkerCommand, OperationResult[None]]):
+class PauseWorkerCommandHandler(CommandHandler[PauseWorkerCommand, OperationResult[bool]]):
     """Handler for PauseWorkerCommand.
 
     DEPRECATED: Delegates to StopCMLWorkerCommand for unified stop/pause handling.
     """
 
-    def __init__(self, mediator: Mediator):
+    def __init__(self, stop_handler: StopCMLWorkerCommandHandler):
         """Initialize the handler.
 
         Args:
-            mediator: Mediator for executing commands
+            stop_handler: Handler the pause is delegated to (called directly, bypassing the mediator)
         """
-        self._mediator = mediator
+        self._stop_handler = stop_handler
 
-    async def handle_async(self, command: PauseWorkerCommand) -> OperationResult[None]:
+    async def handle_async(self, command: PauseWorkerCommand) -> OperationResult[bool]:
         """Execute the command by delegating to StopCMLWorkerCommand.
 
         Args:
             command: Command parameters
 
         Returns:
-            OperationResult indicating success or failure
+            The StopCMLWorkerCommand result, passed through unchanged
         """
         with tracer.start_as_current_span("PauseWorkerCommandHandler.handle_async") as span:
             span.set_attribute("worker_id", command.worker_id)
@@ -76,11 +76,10 @@ class PauseWorkerCommandHandler(CommandHandler[PauseWorkerCommand, OperationResu
                 reason=command.reason,
             )
 
-            result = await self._mediator.execute_async(stop_command)
+            result = await self._stop_handler.handle_async(stop_command)
 
             if result.is_success:
                 span.set_status(Status(StatusCode.OK))
-                return self.no_content()
             else:
                 span.set_status(Status(StatusCode.ERROR, result.error_message or "Unknown error"))
-                return self.bad_request(result.error_message or "Failed to pause worker")
+            return result
@@ -6,6 +6,7 @@ Single Responsibility Principle while maintaining backward compatibility.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -129,8 +130,11 @@ class RefreshWorkerMetricsCommandHandler(
             # Background jobs bypass throttle to ensure regular data collection
             is_user_request = command.initiated_by == "user"
 
-            if is_user_request and not command.force and not self._refresh_throttle.can_refresh(command.worker_id):
-                retry_after = self._refresh_throttle.get_time_until_next_refresh(command.worker_id)
+            now = time.monotonic()
+            throttle = self._refresh_throttle
+            if is_user_request and not command.force and not throttle.can_refresh(command.worker_id, now=now):
+                retry_after = throttle.get_time_until_next_refresh(command.worker_id, now=now)
+                last_refresh_at = throttle.get_last_refresh(command.worker_id)
                 log.info(f"Refresh throttled for worker {command.worker_id} - " f"retry after {retry_after:.1f}s")
                 return self.ok(
                     {
@@ -138,11 +142,7 @@ class RefreshWorkerMetricsCommandHandler(
                         "refresh_skipped": True,
                         "reason": "rate_limited",
                         "retry_after_seconds": retry_after,
-                        "last_refresh_at": (
-                            self._refresh_throttle.get_last_refresh(command.worker_id).isoformat()
-                            if self._refresh_throttle.get_last_refresh(command.worker_id)
-                            else None
-                        ),
+                        "last_refresh_at": last_refresh_at.isoformat() if last_refresh_at else None,
                     }
                 )
 
@@ -170,7 +170,7 @@ class RefreshWorkerMetricsCommandHandler(
 
             # Record refresh attempt (only for user requests to prevent background jobs from blocking user refreshes)
             if is_user_request:
-                self._refresh_throttle.record_refresh(command.worker_id)
+                self._refresh_throttle.record_refresh(command.worker_id, now=now)
 
             results = {}
 
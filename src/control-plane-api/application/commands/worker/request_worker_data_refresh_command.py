@@ -9,6 +9,7 @@ Refreshes all worker data: EC2 metadata, CloudWatch metrics, CML data, and labs.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
@@ -128,8 +129,9 @@ class RequestWorkerDataRefreshCommandHandler(
                 )
 
             # 3. Check throttling
-            if not self._refresh_throttle.can_refresh(command.worker_id):
-                retry_after = self._refresh_throttle.get_time_until_next_refresh(command.worker_id)
+            now = time.monotonic()
+            if not self._refresh_throttle.can_refresh(command.worker_id, now=now):
+                retry_after = self._refresh_throttle.get_time_until_next_refresh(command.worker_id, now=now)
                 retry_after_int = int(retry_after) if retry_after is not None else 0
                 reason = "rate_limited"
 
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -16,17 +17,21 @@ def retry_on_concurrency_conflict(
     max_attempts: int = 3,
     initial_delay: float = 0.1,
     backoff_factor: float = 2.0,
+    max_delay: float = 1.0,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Retry decorator for handling optimistic concurrency conflicts.
 
-    When an OptimisticConcurrencyException occurs, the operation is retried
-    with exponential backoff. This allows the aggregate to be reloaded with
-    the latest version and the operation to be reattempted.
+    When an OptimisticConcurrencyException occurs, the operation is retried so the
+    aggregate can be reloaded with the latest version and the operation reattempted.
+    The first retry is immediate (the competing writer has usually just committed);
+    later retries use capped, decorrelated-jitter backoff so concurrent writers to
+    the same aggregate do not retry in lockstep.
 
     Args:
         max_attempts: Maximum number of retry attempts (including initial attempt)
-        initial_delay: Initial delay in seconds before first retry
-        backoff_factor: Multiplier for delay between retries
+        initial_delay: Lower bound in seconds for backoff delays
+        backoff_factor: Multiplier applied to the previous delay to bound the next one
+        max_delay: Upper bound in seconds for any single delay
 
     Returns:
         Decorated async function with retry logic
@@ -44,7 +49,7 @@ def retry_on_concurrency_conflict(
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
-            delay = initial_delay
+            delay = 0.0
 
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -70,8 +75,11 @@ def retry_on_concurrency_conflict(
                         str(e),
                     )
 
-                    await asyncio.sleep(delay)
-                    delay *= backoff_factor
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    # Decorrelated jitter (not security sensitive)
+                    upper_bound = max(delay, initial_delay) * backoff_factor
+                    delay = min(max_delay, random.uniform(initial_delay, upper_bound))  # nosec
 
             # Should never reach here, but satisfy type checker
             raise last_exception  # type: ignore
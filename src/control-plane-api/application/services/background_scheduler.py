@@ -12,10 +12,12 @@ import contextvars
 import datetime
 import inspect
 import logging
+import re
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from neuroglia.core import ModuleLoader, TypeFinder
 
@@ -41,6 +43,21 @@ except ImportError:
     AsyncIOExecutor = None
     AsyncIOScheduler = None
 
+try:
+    from pymongo.errors import PyMongoError
+except ImportError:
+    PyMongoError = None
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:
+    RedisError = None
+
+# Driver errors raised while building a job store (only those whose driver is installed)
+_JOB_STORE_ERRORS: tuple[type[BaseException], ...] = tuple(
+    error_cls for error_cls in (PyMongoError, RedisError) if error_cls is not None
+)
+
 if TYPE_CHECKING:
     from neuroglia.hosting.abstractions import HostedService
     from neuroglia.hosting.web import WebApplicationBuilder
@@ -56,12 +73,10 @@ log = logging.getLogger(__name__)
 
 # Context variable for service provider in background jobs
 # This is thread-safe and async-safe, unlike global variables
-_service_provider_context: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
-    "service_provider", default=None
-)
+_service_provider_context: contextvars.ContextVar[Any | None] = contextvars.ContextVar("service_provider", default=None)
 
 # Global scheduler instance for access in job wrappers
-_global_scheduler_instance: Optional["BackgroundTaskScheduler"] = None
+_global_scheduler_instance: BackgroundTaskScheduler | None = None
 
 
 class BackgroundTaskException(Exception):
@@ -157,22 +172,30 @@ class RecurrentTaskDescriptor(TaskDescriptor):
     started_at: datetime.datetime | None = None
 
 
+@dataclass(frozen=True, slots=True, eq=False)
 class BackgroundTaskSchedulerOptions:
-    """Represents the configuration options for the background task scheduler."""
+    """Represents the configuration options for the background task scheduler.
 
-    def __init__(self, modules: list[str] | None = None):
-        """Initialize with an empty type mapping.
+    Instances are frozen once built: task types are still added through register_task_type(),
+    but the registered singleton's attributes cannot be rebound by consumers. Equality and hashing
+    stay identity-based.
 
-        Args:
-            modules: List of module paths to scan for @backgroundjob decorators (e.g., ['application.jobs'])
-        """
-        self.type_maps: dict[str, type] = {}
-        self.modules: list[str] = modules or ["application.services"]  # Default for backward compatibility
+    Args:
+        modules: List of module paths to scan for @backgroundjob decorators (e.g., ['application.jobs'])
+    """
+
+    modules: list[str] | None = None
+    type_maps: dict[str, type] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        if not self.modules:
+            # Default for backward compatibility
+            object.__setattr__(self, "modules", ["application.services"])
 
     def register_task_type(self, name: str, task_type: type) -> None:
         """Register a task type with the scheduler."""
         self.type_maps[name] = task_type
-        log.debug(f"Registered background task type '{name}': {task_type}")
+        log.debug("Registered background task type '%s': %s", name, task_type)
 
     def get_task_type(self, name: str) -> type | None:
         """Get a task type by name."""
@@ -182,7 +205,7 @@ class BackgroundTaskSchedulerOptions:
 async def scheduled_job_wrapper(
     task_type_name: str,
     task_id: str,
-    task_data: Dict[str, Any],
+    task_data: dict[str, Any],
     scheduled_at: datetime.datetime,
     **kwargs: Any,
 ) -> Any:
@@ -276,9 +299,9 @@ async def scheduled_job_wrapper(
 
 
 async def recurrent_job_wrapper(
-    task_type_name: Optional[str],
+    task_type_name: str | None,
     task_id: str,
-    task_data: Dict[str, Any],
+    task_data: dict[str, Any],
     interval: int,
     **kwargs: Any,
 ) -> Any:
@@ -371,6 +394,86 @@ async def recurrent_job_wrapper(
         raise
 
 
+def _build_redis_job_store(job_store_config: dict[str, Any]) -> Any | None:
+    """Build the Redis job store, or return None when the Redis dependencies are missing."""
+    if RedisJobStore is None:
+        log.warning("Redis job store requested but Redis dependencies not available")
+        return None
+
+    store = RedisJobStore(
+        db=job_store_config["redis_db"],
+        jobs_key="apscheduler.jobs",
+        run_times_key="apscheduler.run_times",
+        host=job_store_config["redis_host"],
+        port=job_store_config["redis_port"],
+    )
+    log.info(
+        "Configured Redis job store for background tasks (host=%s, db=%s)",
+        job_store_config["redis_host"],
+        job_store_config["redis_db"],
+    )
+    return store
+
+
+def _build_mongo_job_store(job_store_config: dict[str, Any]) -> Any | None:
+    """Build the MongoDB job store, or return None when the MongoDB dependencies are missing."""
+    if MongoDBJobStore is None:
+        log.warning("MongoDB job store requested but MongoDB dependencies not available")
+        return None
+
+    mongo_db = job_store_config.get("mongo_db") or "apscheduler"
+    mongo_collection = job_store_config.get("mongo_collection") or "jobs"
+
+    # Individual parameters are folded into a URI so the client is always built the same way
+    # (pool options and other settings can then be tuned through 'mongo_uri' alone)
+    mongo_uri = job_store_config.get("mongo_uri")
+    if mongo_uri:
+        source = "URI"
+    else:
+        mongo_host = job_store_config.get("mongo_host", "localhost")
+        mongo_port = job_store_config.get("mongo_port", 27017)
+        mongo_uri = f"mongodb://{mongo_host}:{mongo_port}"
+        source = "individual params"
+
+    store = MongoDBJobStore(host=mongo_uri, database=mongo_db, collection=mongo_collection)
+    log.info("Configured MongoDB job store for background tasks (%s)", source)
+    return store
+
+
+# Job store builders keyed on store type, with the key sets that make a complete configuration.
+# MongoDB is listed first: it takes precedence when both stores are fully configured.
+_JOB_STORE_BUILDERS: dict[str, Callable[[dict[str, Any]], Any | None]] = {
+    "mongo": _build_mongo_job_store,
+    "redis": _build_redis_job_store,
+}
+_JOB_STORE_REQUIRED_KEYS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "mongo": (
+        ("mongo_uri", "mongo_db", "mongo_collection"),
+        ("mongo_host", "mongo_port", "mongo_db", "mongo_collection"),
+    ),
+    "redis": (("redis_host", "redis_port", "redis_db"),),
+}
+
+_JOB_STORE_KEY_RE = re.compile(r"^(?:redis|mongo)_")
+
+
+def _require_apscheduler() -> tuple[Any, Any]:
+    """Return the APScheduler AsyncIO executor and scheduler classes, raising if APScheduler is not installed."""
+    if AsyncIOExecutor is None or AsyncIOScheduler is None:
+        raise BackgroundTaskException(
+            "APScheduler AsyncIO components are required. Install with: pip install apscheduler"
+        )
+    return AsyncIOExecutor, AsyncIOScheduler
+
+
+def _resolve_job_store_type(job_store_config: dict[str, Any]) -> str | None:
+    """Return the type of the fully configured job store, if any."""
+    for store_type, key_sets in _JOB_STORE_REQUIRED_KEYS.items():
+        if any(all(key in job_store_config for key in keys) for keys in key_sets):
+            return store_type
+    return None
+
+
 class BackgroundTaskScheduler(HostedService):
     """
     Distributed task scheduler for background job processing.
@@ -385,8 +488,8 @@ class BackgroundTaskScheduler(HostedService):
     def __init__(
         self,
         options: BackgroundTaskSchedulerOptions,
-        scheduler: Optional[Any] = None,
-        service_provider: Optional[Any] = None,
+        scheduler: Any | None = None,
+        service_provider: Any | None = None,
     ):
         """Initialize the background task scheduler.
 
@@ -396,14 +499,11 @@ class BackgroundTaskScheduler(HostedService):
             service_provider: Service provider for dependency injection during deserialization
         """
         # Enforce APScheduler dependency presence early (simplifies type assumptions)
-        if AsyncIOExecutor is None or AsyncIOScheduler is None:
-            raise BackgroundTaskException(
-                "APScheduler AsyncIO components are required. Install with: pip install apscheduler"
-            )
+        executor_cls, scheduler_cls = _require_apscheduler()
 
         # Attribute declarations (improve static analysis clarity)
         self._options: BackgroundTaskSchedulerOptions = options
-        self._service_provider: Optional[Any] = service_provider
+        self._service_provider: Any | None = service_provider
         self._started: bool = False
         self._scheduler: Any  # AsyncIOScheduler instance set below
 
@@ -411,11 +511,6 @@ class BackgroundTaskScheduler(HostedService):
         global _global_scheduler_instance
         _global_scheduler_instance = self
 
-        assert AsyncIOExecutor is not None
-        assert AsyncIOScheduler is not None
-        # Use local aliases to satisfy static analysis (avoid optional None type complaints)
-        executor_cls = AsyncIOExecutor
-        scheduler_cls = AsyncIOScheduler
         if scheduler is not None:
             # Best-effort cast (external code may inject subclass / configured instance)
             self._scheduler = scheduler  # type: ignore[assignment]
@@ -682,7 +777,7 @@ class BackgroundTaskScheduler(HostedService):
             log.error(f"Error enqueuing task '{task.__task_name__}': {ex}")
             raise BackgroundTaskException(f"Failed to enqueue task: {ex}")
 
-    def list_tasks(self) -> List[Any]:
+    def list_tasks(self) -> list[Any]:
         """List all scheduled tasks."""
         try:
             return self._scheduler.get_jobs()
@@ -700,7 +795,7 @@ class BackgroundTaskScheduler(HostedService):
             log.error(f"Error stopping task '{task_id}': {ex}")
             return False
 
-    def get_job(self, task_id: str) -> Optional[Any]:
+    def get_job(self, task_id: str) -> Any | None:
         """Get a job by ID from the scheduler.
 
         Args:
@@ -715,7 +810,7 @@ class BackgroundTaskScheduler(HostedService):
             log.debug(f"Error getting job '{task_id}': {ex}")
             return None
 
-    def get_task_info(self, task_id: str) -> Optional[Dict[str, Any]]:
+    def get_task_info(self, task_id: str) -> dict[str, Any] | None:
         """Get information about a specific task."""
         try:
             job = self._scheduler.get_job(task_id)
@@ -733,7 +828,7 @@ class BackgroundTaskScheduler(HostedService):
             log.error(f"Error getting task info for '{task_id}': {ex}")
             return None
 
-    def get_jobs(self) -> List[Any]:
+    def get_jobs(self) -> list[Any]:
         """Get all scheduled jobs."""
         return self._scheduler.get_jobs()
 
@@ -742,158 +837,134 @@ class BackgroundTaskScheduler(HostedService):
         return len(self.get_jobs())
 
     @staticmethod
-    def configure(builder: "WebApplicationBuilder", modules: list[str]) -> None:
+    def _create_jobstores(job_store_config: dict[str, Any] | None) -> dict[str, Any]:
+        """Build the APScheduler job stores from the background job store settings.
+
+        Called from the scheduler factory rather than from configure() so Redis/MongoDB
+        clients are only created once the scheduler is actually resolved.
+
+        Args:
+            job_store_config: The 'background_job_store' settings, or None when no settings are available
+        """
+        store = BackgroundTaskScheduler._resolve_default_store(job_store_config)
+        return {"default": store} if store is not None else {}
+
+    @staticmethod
+    def _resolve_default_store(job_store_config: dict[str, Any] | None) -> Any | None:
+        """Return the configured default job store, or None to fall back to APScheduler's in-memory store."""
+        if job_store_config is None:
+            log.info("No settings found, using in-memory job store")
+            return None
+
+        store_type = _resolve_job_store_type(job_store_config)
+        if store_type is not None:
+            try:
+                return _JOB_STORE_BUILDERS[store_type](job_store_config)
+            except _JOB_STORE_ERRORS as ex:
+                log.exception("Error configuring %s job store", store_type)
+                raise BackgroundTaskException(f"Failed to configure {store_type} job store: {ex}") from ex
+
+        # Check for incomplete configurations
+        if any(map(_JOB_STORE_KEY_RE.match, job_store_config)):
+            # A Redis host alone is a valid config that relies on the port/db defaults
+            if "redis_host" not in job_store_config:
+                log.warning("Incomplete job store configuration found - check Redis or MongoDB settings")
+        else:
+            log.info("No job store configuration found, using in-memory job store")
+        return None
+
+    @staticmethod
+    def configure(builder: WebApplicationBuilder, modules: list[str]) -> None:
         """Register and configure background task services in the application builder.
 
         Args:
             builder: Application builder instance
             modules: List of module names to scan for background tasks
         """
-        try:
-            if AsyncIOScheduler is None:
-                raise BackgroundTaskException(
-                    "APScheduler is required for background task scheduling. "
-                    "Install it with: pip install apscheduler[redis] or pip install apscheduler[mongodb]"
-                )
-
-            # Create scheduler options and discover tasks
-            options = BackgroundTaskSchedulerOptions(modules=modules)
-
-            # Scan modules for background tasks
-            for module_name in modules:
-                try:
-                    module = ModuleLoader.load(module_name)
-                    background_tasks = TypeFinder.get_types(
-                        module,
-                        lambda cls: inspect.isclass(cls) and hasattr(cls, "__background_task_class_name__"),
-                    )
+        if AsyncIOScheduler is None:
+            raise BackgroundTaskException(
+                "APScheduler is required for background task scheduling. "
+                "Install it with: pip install apscheduler[redis] or pip install apscheduler[mongodb]"
+            )
 
-                    for background_task in background_tasks:
-                        background_task_name = background_task.__background_task_class_name__
-                        background_task_type = background_task.__background_task_type__
+        # Create scheduler options and discover tasks
+        options = BackgroundTaskSchedulerOptions(modules=modules)
 
-                        options.register_task_type(background_task_name, background_task)
-                        builder.services.add_transient(background_task, background_task)
+        # Scan modules for background tasks
+        for module_name in modules:
+            try:
+                module = ModuleLoader.load(module_name)
+                background_tasks = TypeFinder.get_types(
+                    module,
+                    lambda cls: inspect.isclass(cls) and hasattr(cls, "__background_task_class_name__"),
+                )
 
-                        log.info(
-                            f"Registered background task '{background_task_name}' of type '{background_task_type}'"
-                        )
+                for background_task in background_tasks:
+                    background_task_name = background_task.__background_task_class_name__
+                    background_task_type = background_task.__background_task_type__
 
-                except Exception as ex:
-                    log.error(f"Error scanning module '{module_name}' for background tasks: {ex}")
-                    continue
+                    options.register_task_type(background_task_name, background_task)
+                    builder.services.add_transient(background_task, background_task)
 
-            # Configure job stores if settings are available
-            jobstores = {}
-            if hasattr(builder, "settings"):
-                job_store_config = getattr(builder.settings, "background_job_store", {})
-
-                # Check for Redis configuration
-                redis_keys = ["redis_host", "redis_port", "redis_db"]
-                if all(key in job_store_config for key in redis_keys):
-                    if RedisJobStore is not None:
-                        jobstores["default"] = RedisJobStore(
-                            db=job_store_config["redis_db"],
-                            jobs_key="apscheduler.jobs",
-                            run_times_key="apscheduler.run_times",
-                            host=job_store_config["redis_host"],
-                            port=job_store_config["redis_port"],
-                        )
-                        log.info(
-                            f"Configured Redis job store for background tasks (host={job_store_config['redis_host']}, db={job_store_config['redis_db']})"
-                        )
-                    else:
-                        log.warning("Redis job store requested but Redis dependencies not available")
-
-                mongo_uri_keys = ["mongo_uri", "mongo_db", "mongo_collection"]
-                mongo_individual_keys = [
-                    "mongo_host",
-                    "mongo_port",
-                    "mongo_db",
-                    "mongo_collection",
-                ]
-                # Check for MongoDB configuration
-                if all(key in job_store_config for key in mongo_uri_keys) or all(
-                    key in job_store_config for key in mongo_individual_keys
-                ):
-                    if MongoDBJobStore is not None:
-                        # Support both URI and individual parameter configuration
-                        if "mongo_uri" in job_store_config:
-                            mongo_uri = job_store_config.get("mongo_uri")
-                            mongo_db = job_store_config.get("mongo_db") or "apscheduler"
-                            mongo_collection = job_store_config.get("mongo_collection") or "jobs"
-                            jobstores["default"] = MongoDBJobStore(
-                                host=mongo_uri,
-                                database=mongo_db,
-                                collection=mongo_collection,
-                            )
-                            log.info("Configured MongoDB job store for background tasks (URI)")
-                        else:
-                            # Individual parameters
-                            mongo_host = job_store_config.get("mongo_host", "localhost")
-                            mongo_port = job_store_config.get("mongo_port", 27017)
-                            mongo_db = job_store_config.get("mongo_db") or "apscheduler"
-                            mongo_collection = job_store_config.get("mongo_collection") or "jobs"
-
-                            jobstores["default"] = MongoDBJobStore(
-                                host=mongo_host,
-                                port=mongo_port,
-                                database=mongo_db,
-                                collection=mongo_collection,
-                            )
-                            log.info("Configured MongoDB job store for background tasks (individual params)")
-                    else:
-                        log.warning("MongoDB job store requested but MongoDB dependencies not available")
-
-                # Check for incomplete configurations
-                elif any(key.startswith(("redis_", "mongo_")) for key in job_store_config.keys()):
-                    # Check if we have enough Redis config to proceed despite missing keys (e.g. defaults)
-                    redis_essential = ["redis_host"]
-                    if all(key in job_store_config for key in redis_essential):
-                        # We have host, port defaults to 6379, db defaults to 0 if missing.
-                        # This is likely a valid config that just relies on defaults.
-                        pass
-                    else:
-                        log.warning("Incomplete job store configuration found - check Redis or MongoDB settings")
+                    log.info("Registered background task '%s' of type '%s'", background_task_name, background_task_type)
 
-                else:
-                    log.info("No job store configuration found, using in-memory job store")
-            else:
-                log.info("No settings found, using in-memory job store")
-
-            # Register services
-            # Executor & Scheduler types are guaranteed (checked above); cast to satisfy type expectations
-            assert AsyncIOExecutor is not None
-            assert AsyncIOScheduler is not None
-            executor_cls = AsyncIOExecutor  # type: ignore[assignment]
-            scheduler_cls = AsyncIOScheduler  # type: ignore[assignment]
-            builder.services.add_singleton(executor_cls, executor_cls)  # type: ignore[arg-type]
-            builder.services.add_singleton(
-                scheduler_cls,
-                implementation_factory=lambda provider: scheduler_cls(
-                    executors={"default": provider.get_service(executor_cls)},  # type: ignore[arg-type]
-                    jobstores=jobstores,
-                ),
-            )
-            builder.services.add_singleton(BackgroundTaskSchedulerOptions, singleton=options)
-
-            # Register as both HostedService and BackgroundTaskScheduler
-            builder.services.add_singleton(
-                BackgroundTaskScheduler,
-                implementation_factory=lambda provider: BackgroundTaskScheduler(
-                    provider.get_required_service(BackgroundTaskSchedulerOptions),
-                    provider.get_required_service(scheduler_cls),
-                    service_provider=provider,
-                ),
-            )
-            builder.services.add_singleton(
-                HostedService,
-                implementation_factory=lambda provider: provider.get_service(BackgroundTaskScheduler),
-            )
-            log.info("✅ Background task scheduler services registered successfully")
+            except Exception as ex:
+                log.error("Error scanning module '%s' for background tasks: %s", module_name, ex)
+                continue
 
-        except Exception as ex:
-            log.error(f"Error configuring background task scheduler: {ex}")
-            raise BackgroundTaskException(f"Failed to configure background task scheduler: {ex}")
-            raise BackgroundTaskException(f"Failed to configure background task scheduler: {ex}")
-            raise BackgroundTaskException(f"Failed to configure background task scheduler: {ex}")
+        # Job stores are built by the scheduler factory on first resolution (see _create_jobstores).
+        # Only the job store keys are copied so the factory does not keep the settings object alive.
+        job_store_config = None
+        if hasattr(builder, "settings"):
+            background_job_store = getattr(builder.settings, "background_job_store", None) or {}
+            job_store_config = {
+                key: value for key, value in background_job_store.items() if _JOB_STORE_KEY_RE.match(key)
+            }
+
+        # Register services
+        executor_cls, scheduler_cls = _require_apscheduler()
+        builder.services.add_singleton(executor_cls, executor_cls)  # type: ignore[arg-type]
+        builder.services.add_singleton(
+            scheduler_cls,
+            implementation_factory=_make_asyncio_scheduler_factory(job_store_config),
+        )
+        builder.services.add_singleton(BackgroundTaskSchedulerOptions, singleton=options)
+
+        # Register as both HostedService and BackgroundTaskScheduler
+        builder.services.add_singleton(
+            BackgroundTaskScheduler,
+            implementation_factory=_create_background_task_scheduler,
+        )
+        builder.services.add_singleton(
+            HostedService,
+            implementation_factory=_resolve_background_task_scheduler,
+        )
+        log.info("✅ Background task scheduler services registered successfully")
+
+
+def _make_asyncio_scheduler_factory(job_store_config: dict[str, Any] | None) -> Callable[[Any], Any]:
+    """Create the AsyncIOScheduler service factory bound to the given job store settings."""
+
+    def _factory(provider: Any) -> Any:
+        executor_cls, scheduler_cls = _require_apscheduler()
+        return scheduler_cls(
+            executors={"default": provider.get_service(executor_cls)},
+            jobstores=BackgroundTaskScheduler._create_jobstores(job_store_config),
+        )
+
+    return _factory
+
+
+def _create_background_task_scheduler(provider: Any) -> BackgroundTaskScheduler:
+    """Service factory for the BackgroundTaskScheduler singleton."""
+    _, scheduler_cls = _require_apscheduler()
+    return BackgroundTaskScheduler(
+        provider.get_required_service(BackgroundTaskSchedulerOptions),
+        provider.get_required_service(scheduler_cls),
+        service_provider=provider,
+    )
+
+
+def _resolve_background_task_scheduler(provider: Any) -> BackgroundTaskScheduler | None:
+    """Service factory exposing the BackgroundTaskScheduler singleton as a HostedService."""
+    return provider.get_service(BackgroundTaskScheduler)
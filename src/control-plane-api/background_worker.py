@@ -14,6 +14,13 @@ from types import FrameType
 
 from application.services.background_scheduler import BackgroundTaskScheduler
 from application.services.sse_event_relay import SSEEventRelayHostedService
+from integration.services.cml_api_client import CMLApiClientFactory
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the default asyncio loop
+    uvloop = None
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -86,10 +93,17 @@ async def run_worker() -> None:
         await sse_relay_service.stop_async()
         log.info("✅ SSE event relay service stopped cleanly")
 
+        cml_client_factory = app.state.services.get_service(CMLApiClientFactory)
+        if cml_client_factory is not None:
+            await cml_client_factory.aclose()
+
 
 if __name__ == "__main__":
     try:
-        asyncio.run(run_worker())
+        if uvloop is not None:
+            uvloop.run(run_worker())
+        else:
+            asyncio.run(run_worker())
     except KeyboardInterrupt:
         log.info("Interrupted by user")
     sys.exit(0)
@@ -3,15 +3,19 @@
 The CML Worker represents an AWS EC2 instance running Cisco Modeling Lab.
 It manages the lifecycle of the instance, monitors telemetry, and provides
 access to CML labs hosted on the instance.
+
+Persistence is state-based: MongoCMLWorkerRepository stores the serialized CMLWorkerState document and
+rehydrates workers from it directly. Domain events are published but never replayed, so loading a worker
+costs the same regardless of how many metrics events it has emitted.
 """
 
+from collections.abc import Callable
 from dataclasses import replace
 from datetime import datetime, timezone
-from typing import cast
+from typing import Any, ClassVar
 from urllib.parse import urlparse
 from uuid import uuid4
 
-from multipledispatch import dispatch
 from neuroglia.data.abstractions import AggregateRoot, AggregateState
 
 from domain.enums import CMLServiceStatus, CMLWorkerStatus, LicenseStatus
@@ -61,11 +65,33 @@ from domain.value_objects.cml_metrics import (
     DiskStats,
     DomInfoStats,
     MemoryStats,
+    direct_utilization,
 )
 
+# EC2 instance state -> worker status for imported instances (anything else maps to UNKNOWN)
+_EC2_STATE_TO_STATUS: dict[str, CMLWorkerStatus] = {
+    "running": CMLWorkerStatus.RUNNING,
+    "stopped": CMLWorkerStatus.STOPPED,
+    "stopping": CMLWorkerStatus.STOPPING,
+    "pending": CMLWorkerStatus.PENDING,
+}
+
+
+def _pct_changed(old: float | None, new: float | None) -> float:
+    """Relative change in percent; a change from/to None or away from 0 counts as 100%."""
+    if old == new:
+        return 0.0
+    if old is None or new is None or old == 0:
+        return 100.0
+    return abs(new - old) / abs(old) * 100.0
+
 
 class CMLWorkerState(AggregateState[str]):
-    """Encapsulates the persisted state for the CML Worker aggregate."""
+    """Encapsulates the persisted state for the CML Worker aggregate.
+
+    Deliberately not slotted: neuroglia's JsonSerializer persists and rehydrates state through ``__dict__``
+    (``object.__new__`` + ``instance.__dict__ = fields``), and ``AggregateState`` itself carries a ``__dict__``.
+    """
 
     id: str
     name: str
@@ -204,8 +230,7 @@ class CMLWorkerState(AggregateState[str]):
         self.created_by = None
         self.terminated_by = None
 
-    @dispatch(CMLWorkerCreatedDomainEvent)
-    def on(self, event: CMLWorkerCreatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_created(self, event: CMLWorkerCreatedDomainEvent) -> None:
         """Apply the creation event to the state."""
         self.id = event.aggregate_id
         self.name = event.name
@@ -222,8 +247,7 @@ class CMLWorkerState(AggregateState[str]):
         self.updated_at = event.created_at
         self.created_by = event.created_by
 
-    @dispatch(CMLWorkerImportedDomainEvent)
-    def on(self, event: CMLWorkerImportedDomainEvent) -> None:  # type: ignore[override]
+    def _on_imported(self, event: CMLWorkerImportedDomainEvent) -> None:
         """Apply the import event to the state."""
         self.id = event.aggregate_id
         self.name = event.name
@@ -241,66 +265,67 @@ class CMLWorkerState(AggregateState[str]):
         self.created_by = event.created_by
 
         # Map EC2 instance state to CMLWorkerStatus
-        if event.instance_state == "running":
-            self.status = CMLWorkerStatus.RUNNING
-        elif event.instance_state == "stopped":
-            self.status = CMLWorkerStatus.STOPPED
-        elif event.instance_state == "stopping":
-            self.status = CMLWorkerStatus.STOPPING
-        elif event.instance_state == "pending":
-            self.status = CMLWorkerStatus.PENDING
-        else:
-            self.status = CMLWorkerStatus.UNKNOWN
+        self.status = _EC2_STATE_TO_STATUS.get(event.instance_state, CMLWorkerStatus.UNKNOWN)
 
-    @dispatch(CMLWorkerStatusUpdatedDomainEvent)
-    def on(self, event: CMLWorkerStatusUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_status_updated(self, event: CMLWorkerStatusUpdatedDomainEvent) -> None:
         """Apply the status updated event to the state."""
         self.status = event.new_status
         self.updated_at = event.updated_at
         # Track transition initiation timestamps for long-running operations
-        if event.new_status == CMLWorkerStatus.PENDING:
-            # Starting
-            self.start_initiated_at = event.transition_initiated_at or event.updated_at
-        elif event.new_status == CMLWorkerStatus.RUNNING:
-            # Clear start transition marker once running
-            self.start_initiated_at = None
-        elif event.new_status == CMLWorkerStatus.STOPPING:
-            self.stop_initiated_at = event.transition_initiated_at or event.updated_at
-            # Set service status to unavailable when stopping
-            self.service_status = CMLServiceStatus.UNAVAILABLE
-        elif event.new_status == CMLWorkerStatus.STOPPED:
-            self.stop_initiated_at = None
-            # Reset mutable network fields - EC2 releases public IP when stopped
-            self.public_ip = None
-            self.private_ip = None
-            self.https_endpoint = None
-            # Reset service status
-            self.service_status = CMLServiceStatus.UNAVAILABLE
-            # Reset resource utilization metrics
-            self.cloudwatch_cpu_utilization = None
-            self.cloudwatch_memory_utilization = None
-            self.cloudwatch_last_collected_at = None
-            # Reset CML metrics (worker is not running, no CML data available)
-            self.metrics = CMLMetrics()
-
-    @dispatch(CMLServiceStatusUpdatedDomainEvent)
-    def on(self, event: CMLServiceStatusUpdatedDomainEvent) -> None:  # type: ignore[override]
+        transition = self._STATUS_TRANSITIONS.get(event.new_status)
+        if transition is not None:
+            transition(self, event)
+
+    def _on_start_initiated(self, event: CMLWorkerStatusUpdatedDomainEvent) -> None:
+        self.start_initiated_at = event.transition_initiated_at or event.updated_at
+
+    def _on_started(self, event: CMLWorkerStatusUpdatedDomainEvent) -> None:
+        # Clear start transition marker once running
+        self.start_initiated_at = None
+
+    def _on_stop_initiated(self, event: CMLWorkerStatusUpdatedDomainEvent) -> None:
+        self.stop_initiated_at = event.transition_initiated_at or event.updated_at
+        # Set service status to unavailable when stopping
+        self.service_status = CMLServiceStatus.UNAVAILABLE
+
+    def _on_stopped(self, event: CMLWorkerStatusUpdatedDomainEvent) -> None:
+        self.stop_initiated_at = None
+        # Reset mutable network fields - EC2 releases public IP when stopped
+        self.public_ip = None
+        self.private_ip = None
+        self.https_endpoint = None
+        # Reset service status
+        self.service_status = CMLServiceStatus.UNAVAILABLE
+        # Reset resource utilization metrics
+        self.cloudwatch_cpu_utilization = None
+        self.cloudwatch_memory_utilization = None
+        self.cloudwatch_last_collected_at = None
+        # Reset CML metrics (worker is not running, no CML data available)
+        self.metrics = CMLMetrics()
+
+    # New status -> side effects of entering it (other statuses have none)
+    _STATUS_TRANSITIONS: ClassVar[dict[CMLWorkerStatus, Callable[["CMLWorkerState", Any], None]]] = {
+        CMLWorkerStatus.PENDING: _on_start_initiated,
+        CMLWorkerStatus.RUNNING: _on_started,
+        CMLWorkerStatus.STOPPING: _on_stop_initiated,
+        CMLWorkerStatus.STOPPED: _on_stopped,
+    }
+
+    def _on_cml_service_status_updated(self, event: CMLServiceStatusUpdatedDomainEvent) -> None:
         """Apply the service status updated event to the state."""
         self.service_status = event.new_service_status
         if event.https_endpoint:
             self.https_endpoint = event.https_endpoint
         self.updated_at = event.updated_at
 
-    @dispatch(CMLWorkerInstanceAssignedDomainEvent)
-    def on(self, event: CMLWorkerInstanceAssignedDomainEvent) -> None:  # type: ignore[override]
+    def _on_instance_assigned(self, event: CMLWorkerInstanceAssignedDomainEvent) -> None:
         """Apply the instance assigned event to the state."""
         self.aws_instance_id = event.aws_instance_id
         self.public_ip = event.public_ip
         self.private_ip = event.private_ip
         self.updated_at = event.assigned_at
 
-    @dispatch(CMLWorkerLicenseUpdatedDomainEvent)
-    def on(self, event: CMLWorkerLicenseUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_updated(self, event: CMLWorkerLicenseUpdatedDomainEvent) -> None:
         """Apply the license updated event to the state."""
         self.license = replace(
             self.license,
@@ -309,16 +334,14 @@ class CMLWorkerState(AggregateState[str]):
         )
         self.updated_at = event.updated_at
 
-    @dispatch(EC2MetricsUpdatedDomainEvent)
-    def on(self, event: EC2MetricsUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_ec2_metrics_updated(self, event: EC2MetricsUpdatedDomainEvent) -> None:
         """Apply EC2 metrics event to the state."""
         self.ec2_instance_state_detail = event.instance_state_detail
         self.ec2_system_status_check = event.system_status_check
         self.ec2_last_checked_at = event.checked_at
         self.updated_at = event.updated_at
 
-    @dispatch(EC2InstanceDetailsUpdatedDomainEvent)
-    def on(self, event: EC2InstanceDetailsUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_ec2_instance_details_updated(self, event: EC2InstanceDetailsUpdatedDomainEvent) -> None:
         """Apply EC2 instance details event to the state."""
         self.public_ip = event.public_ip
         self.private_ip = event.private_ip
@@ -329,16 +352,14 @@ class CMLWorkerState(AggregateState[str]):
         self.ami_creation_date = event.ami_creation_date
         self.updated_at = event.updated_at
 
-    @dispatch(CloudWatchMetricsUpdatedDomainEvent)
-    def on(self, event: CloudWatchMetricsUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_cloudwatch_metrics_updated(self, event: CloudWatchMetricsUpdatedDomainEvent) -> None:
         """Apply CloudWatch metrics event to the state."""
         self.cloudwatch_cpu_utilization = event.cpu_utilization
         self.cloudwatch_memory_utilization = event.memory_utilization
         self.cloudwatch_last_collected_at = event.collected_at
         self.updated_at = event.updated_at
 
-    @dispatch(CMLMetricsUpdatedDomainEvent)
-    def on(self, event: CMLMetricsUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_cml_metrics_updated(self, event: CMLMetricsUpdatedDomainEvent) -> None:
         """Apply CML API metrics event to the state."""
         info = event.system_info or {}
         health = event.system_health or {}
@@ -463,8 +484,7 @@ class CMLWorkerState(AggregateState[str]):
             else:
                 self.license = replace(self.license, raw_info=event.license_info)
 
-    @dispatch(CMLWorkerTelemetryUpdatedDomainEvent)
-    def on(self, event: CMLWorkerTelemetryUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_telemetry_updated(self, event: CMLWorkerTelemetryUpdatedDomainEvent) -> None:
         """Handle telemetry updated event."""
         self.updated_at = event.updated_at
         if event.poll_interval is not None:
@@ -472,16 +492,14 @@ class CMLWorkerState(AggregateState[str]):
         if event.next_refresh_at is not None:
             self.next_refresh_at = event.next_refresh_at
 
-    @dispatch(CMLWorkerEndpointUpdatedDomainEvent)
-    def on(self, event: CMLWorkerEndpointUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_endpoint_updated(self, event: CMLWorkerEndpointUpdatedDomainEvent) -> None:
         """Apply the endpoint updated event to the state."""
         self.https_endpoint = event.https_endpoint
         if event.public_ip:
             self.public_ip = event.public_ip
         self.updated_at = event.updated_at
 
-    @dispatch(CMLWorkerTerminatedDomainEvent)
-    def on(self, event: CMLWorkerTerminatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_terminated(self, event: CMLWorkerTerminatedDomainEvent) -> None:
         """Apply the terminated event to the state."""
         self.status = CMLWorkerStatus.TERMINATED
         self.service_status = CMLServiceStatus.UNAVAILABLE
@@ -489,50 +507,42 @@ class CMLWorkerState(AggregateState[str]):
         self.terminated_by = event.terminated_by
         self.updated_at = event.terminated_at
 
-    @dispatch(CMLWorkerTagsUpdatedDomainEvent)
-    def on(self, event: CMLWorkerTagsUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_tags_updated(self, event: CMLWorkerTagsUpdatedDomainEvent) -> None:
         """Apply AWS tags update to the state."""
         self.aws_tags = event.aws_tags
         self.updated_at = event.updated_at
 
-    @dispatch(CMLWorkerLicenseRegistrationStartedDomainEvent)
-    def on(self, event: CMLWorkerLicenseRegistrationStartedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_registration_started(self, event: CMLWorkerLicenseRegistrationStartedDomainEvent) -> None:
         """Apply license registration started event to the state."""
         self.license = replace(self.license, operation_in_progress=True)
         self.updated_at = datetime.fromisoformat(event.started_at)
 
-    @dispatch(CMLWorkerLicenseRegistrationCompletedDomainEvent)
-    def on(self, event: CMLWorkerLicenseRegistrationCompletedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_registration_completed(self, event: CMLWorkerLicenseRegistrationCompletedDomainEvent) -> None:
         """Apply license registration completed event to the state."""
         self.license = replace(self.license, status=LicenseStatus.REGISTERED, operation_in_progress=False)
         self.updated_at = datetime.fromisoformat(event.completed_at)
 
-    @dispatch(CMLWorkerLicenseRegistrationFailedDomainEvent)
-    def on(self, event: CMLWorkerLicenseRegistrationFailedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_registration_failed(self, event: CMLWorkerLicenseRegistrationFailedDomainEvent) -> None:
         """Apply license registration failed event to the state."""
         self.license = replace(self.license, operation_in_progress=False)
         self.updated_at = datetime.fromisoformat(event.failed_at)
 
-    @dispatch(CMLWorkerLicenseDeregistrationStartedDomainEvent)
-    def on(self, event: CMLWorkerLicenseDeregistrationStartedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_deregistration_started(self, event: CMLWorkerLicenseDeregistrationStartedDomainEvent) -> None:
         """Apply license deregistration started event to the state."""
         self.license = replace(self.license, operation_in_progress=True)
         self.updated_at = datetime.fromisoformat(event.started_at)
 
-    @dispatch(CMLWorkerLicenseDeregistrationCompletedDomainEvent)
-    def on(self, event: CMLWorkerLicenseDeregistrationCompletedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_deregistration_completed(self, event: CMLWorkerLicenseDeregistrationCompletedDomainEvent) -> None:
         """Apply license deregistration completed event to the state."""
         self.license = replace(self.license, status=LicenseStatus.UNREGISTERED, operation_in_progress=False)
         self.updated_at = datetime.fromisoformat(event.completed_at)
 
-    @dispatch(CMLWorkerLicenseDeregistrationFailedDomainEvent)
-    def on(self, event: CMLWorkerLicenseDeregistrationFailedDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_deregistration_failed(self, event: CMLWorkerLicenseDeregistrationFailedDomainEvent) -> None:
         """Apply license deregistration failed event to the state."""
         self.license = replace(self.license, operation_in_progress=False)
         self.updated_at = datetime.fromisoformat(event.failed_at)
 
-    @dispatch(CMLWorkerLicenseDeregisteredDomainEvent)
-    def on(self, event: CMLWorkerLicenseDeregisteredDomainEvent) -> None:  # type: ignore[override]
+    def _on_license_deregistered(self, event: CMLWorkerLicenseDeregisteredDomainEvent) -> None:
         """Apply license deregistered event to the state."""
         self.license = replace(self.license, status=LicenseStatus.UNREGISTERED, raw_info=None)
         self.updated_at = datetime.fromisoformat(event.deregistered_at)
@@ -547,32 +557,27 @@ class CMLWorkerState(AggregateState[str]):
             )
             self.metrics = replace(self.metrics, system_health=new_health)
 
-    @dispatch(WorkerDataRefreshRequestedDomainEvent)
-    def on(self, event: WorkerDataRefreshRequestedDomainEvent) -> None:  # type: ignore[override]
+    def _on_worker_data_refresh_requested(self, event: WorkerDataRefreshRequestedDomainEvent) -> None:
         """Apply data refresh requested event to the state."""
         # No state changes needed - event is for notification only
         pass
 
-    @dispatch(WorkerDataRefreshSkippedDomainEvent)
-    def on(self, event: WorkerDataRefreshSkippedDomainEvent) -> None:  # type: ignore[override]
+    def _on_worker_data_refresh_skipped(self, event: WorkerDataRefreshSkippedDomainEvent) -> None:
         """Apply data refresh skipped event to the state."""
         # No state changes needed - event is for notification only
         pass
 
-    @dispatch(WorkerDataRefreshCompletedDomainEvent)
-    def on(self, event: WorkerDataRefreshCompletedDomainEvent) -> None:  # type: ignore[override]
+    def _on_worker_data_refresh_completed(self, event: WorkerDataRefreshCompletedDomainEvent) -> None:
         """Apply data refresh completed event to the state."""
         # No state changes needed - event is for notification only
         pass
 
-    @dispatch(CloudWatchMonitoringUpdatedDomainEvent)
-    def on(self, event: CloudWatchMonitoringUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_cloudwatch_monitoring_updated(self, event: CloudWatchMonitoringUpdatedDomainEvent) -> None:
         """Apply the CloudWatch monitoring updated event to the state."""
         self.cloudwatch_detailed_monitoring_enabled = event.enabled
         self.updated_at = event.updated_at
 
-    @dispatch(WorkerActivityUpdatedDomainEvent)
-    def on(self, event: WorkerActivityUpdatedDomainEvent) -> None:  # type: ignore[override]
+    def _on_worker_activity_updated(self, event: WorkerActivityUpdatedDomainEvent) -> None:
         """Apply activity tracking update to the state.
 
         Note: Only updates last_activity_at if new activity detected (non-None).
@@ -589,8 +594,7 @@ class CMLWorkerState(AggregateState[str]):
         self.target_pause_at = event.target_pause_at
         self.updated_at = event.updated_at
 
-    @dispatch(WorkerPausedDomainEvent)
-    def on(self, event: WorkerPausedDomainEvent) -> None:  # type: ignore[override]
+    def _on_worker_paused(self, event: WorkerPausedDomainEvent) -> None:
         """Apply pause event to the state."""
         self.pause_reason = event.pause_reason
         self.paused_by = event.paused_by
@@ -600,8 +604,7 @@ class CMLWorkerState(AggregateState[str]):
         self.target_pause_at = None  # Clear target since paused
         self.updated_at = event.paused_at
 
-    @dispatch(WorkerResumedDomainEvent)
-    def on(self, event: WorkerResumedDomainEvent) -> None:  # type: ignore[override]
+    def _on_worker_resumed(self, event: WorkerResumedDomainEvent) -> None:
         """Apply resume event to the state."""
         self.last_resumed_at = event.resumed_at
         self.auto_resume_count = event.auto_resume_count
@@ -613,12 +616,51 @@ class CMLWorkerState(AggregateState[str]):
             self.paused_by = None
         self.updated_at = event.resumed_at
 
-    @dispatch(IdleDetectionToggledDomainEvent)
-    def on(self, event: IdleDetectionToggledDomainEvent) -> None:  # type: ignore[override]
+    def _on_idle_detection_toggled(self, event: IdleDetectionToggledDomainEvent) -> None:
         """Apply idle detection toggle event to the state."""
         self.is_idle_detection_enabled = event.is_enabled
         self.updated_at = event.toggled_at
 
+    # Event type -> apply method; one handler per event type, so a dict lookup replaces multipledispatch
+    _HANDLERS: ClassVar[dict[type, Callable[["CMLWorkerState", Any], None]]] = {
+        CMLWorkerCreatedDomainEvent: _on_created,
+        CMLWorkerImportedDomainEvent: _on_imported,
+        CMLWorkerStatusUpdatedDomainEvent: _on_status_updated,
+        CMLServiceStatusUpdatedDomainEvent: _on_cml_service_status_updated,
+        CMLWorkerInstanceAssignedDomainEvent: _on_instance_assigned,
+        CMLWorkerLicenseUpdatedDomainEvent: _on_license_updated,
+        EC2MetricsUpdatedDomainEvent: _on_ec2_metrics_updated,
+        EC2InstanceDetailsUpdatedDomainEvent: _on_ec2_instance_details_updated,
+        CloudWatchMetricsUpdatedDomainEvent: _on_cloudwatch_metrics_updated,
+        CMLMetricsUpdatedDomainEvent: _on_cml_metrics_updated,
+        CMLWorkerTelemetryUpdatedDomainEvent: _on_telemetry_updated,
+        CMLWorkerEndpointUpdatedDomainEvent: _on_endpoint_updated,
+        CMLWorkerTerminatedDomainEvent: _on_terminated,
+        CMLWorkerTagsUpdatedDomainEvent: _on_tags_updated,
+        CMLWorkerLicenseRegistrationStartedDomainEvent: _on_license_registration_started,
+        CMLWorkerLicenseRegistrationCompletedDomainEvent: _on_license_registration_completed,
+        CMLWorkerLicenseRegistrationFailedDomainEvent: _on_license_registration_failed,
+        CMLWorkerLicenseDeregistrationStartedDomainEvent: _on_license_deregistration_started,
+        CMLWorkerLicenseDeregistrationCompletedDomainEvent: _on_license_deregistration_completed,
+        CMLWorkerLicenseDeregistrationFailedDomainEvent: _on_license_deregistration_failed,
+        CMLWorkerLicenseDeregisteredDomainEvent: _on_license_deregistered,
+        WorkerDataRefreshRequestedDomainEvent: _on_worker_data_refresh_requested,
+        WorkerDataRefreshSkippedDomainEvent: _on_worker_data_refresh_skipped,
+        WorkerDataRefreshCompletedDomainEvent: _on_worker_data_refresh_completed,
+        CloudWatchMonitoringUpdatedDomainEvent: _on_cloudwatch_monitoring_updated,
+        WorkerActivityUpdatedDomainEvent: _on_worker_activity_updated,
+        WorkerPausedDomainEvent: _on_worker_paused,
+        WorkerResumedDomainEvent: _on_worker_resumed,
+        IdleDetectionToggledDomainEvent: _on_idle_detection_toggled,
+    }
+
+    def on(self, event: Any) -> None:
+        """Apply a domain event to the state."""
+        handler = self._HANDLERS.get(type(event))
+        if handler is None:
+            raise NotImplementedError(f"CMLWorkerState has no handler for {type(event).__name__}")
+        handler(self, event)
+
 
 class CMLWorker(AggregateRoot[CMLWorkerState, str]):
     """CML Worker aggregate root following the AggregateState pattern.
@@ -776,10 +818,10 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
 
     def id(self) -> str:
         """Return the aggregate identifier with a precise type."""
-        aggregate_id = super().id()
+        aggregate_id = self.state.id
         if aggregate_id is None:
             raise ValueError("CMLWorker aggregate identifier has not been initialized")
-        return cast(str, aggregate_id)
+        return aggregate_id
 
     def update_status(self, new_status: CMLWorkerStatus) -> bool:
         """Update the EC2 instance status.
@@ -790,7 +832,7 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
         Returns:
             True if status was changed, False if already at that status
         """
-        if self.state.status == new_status:
+        if self.state.status is new_status:
             return False
 
         old_status = self.state.status
@@ -825,7 +867,7 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
         Returns:
             True if status was changed, False if already at that status
         """
-        if self.state.service_status == new_service_status and self.state.https_endpoint == https_endpoint:
+        if self.state.service_status is new_service_status and self.state.https_endpoint == https_endpoint:
             return False
 
         old_service_status = self.state.service_status
@@ -909,14 +951,15 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
             system_status_check: System status check (e.g., "ok", "impaired")
             checked_at: Timestamp of the status check
         """
+        now = datetime.now(timezone.utc)
         self.state.on(
             self.register_event(  # type: ignore
                 EC2MetricsUpdatedDomainEvent(
                     aggregate_id=self.id(),
                     instance_state_detail=instance_state_detail,
                     system_status_check=system_status_check,
-                    checked_at=checked_at or datetime.now(timezone.utc),
-                    updated_at=datetime.now(timezone.utc),
+                    checked_at=checked_at or now,
+                    updated_at=now,
                 )
             )
         )
@@ -985,14 +1028,15 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
             memory_utilization: Memory utilization percentage (0-100)
             collected_at: Timestamp when metrics were collected
         """
+        now = datetime.now(timezone.utc)
         self.state.on(
             self.register_event(  # type: ignore
                 CloudWatchMetricsUpdatedDomainEvent(
                     aggregate_id=self.id(),
                     cpu_utilization=cpu_utilization,
                     memory_utilization=memory_utilization,
-                    collected_at=collected_at or datetime.now(timezone.utc),
-                    updated_at=datetime.now(timezone.utc),
+                    collected_at=collected_at or now,
+                    updated_at=now,
                 )
             )
         )
@@ -1024,40 +1068,14 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
         # Domain-level suppression: only emit event if meaningful delta
         # Always emit when no prior system_info or threshold not provided
         emit_event = True
-        if change_threshold_percent is not None and self.state.metrics.system_info:
+        # Labs/version changes always emit, so only derive utilization deltas when both are unchanged
+        if (
+            change_threshold_percent is not None
+            and self.state.metrics.system_info
+            and labs_count == self.state.metrics.labs_count
+            and cml_version == self.state.metrics.version
+        ):
             try:
-                prev_metrics = self.state.metrics
-                prev_cpu, prev_mem, prev_storage = prev_metrics.get_utilization()
-
-                # Calculate new utilization using temporary metrics object
-                # This avoids duplicating the calculation logic
-                temp_metrics = CMLMetrics(
-                    system_info=CMLSystemInfo(
-                        cpu_utilization=system_info.get("all_cpu_percent"),
-                        memory_total=system_info.get("all_memory_total"),
-                        memory_used=system_info.get("all_memory_used"),
-                        disk_total=system_info.get("all_disk_total"),
-                        disk_used=system_info.get("all_disk_used"),
-                        running_nodes=system_info.get("running_nodes"),
-                        total_nodes=system_info.get("total_nodes"),
-                        computes=system_info.get("computes", {}),
-                    )
-                )
-                new_cpu, new_mem, new_storage = temp_metrics.get_utilization()
-
-                def pct_changed(old: float | None, new: float | None) -> float:
-                    if old is None or new is None:
-                        return 100.0 if old != new else 0.0
-                    if old == 0:
-                        return 100.0 if new != 0 else 0.0
-                    return abs(new - old) / abs(old) * 100.0
-
-                cpu_delta = pct_changed(prev_cpu, new_cpu)
-                mem_delta = pct_changed(prev_mem, new_mem)
-                storage_delta = pct_changed(prev_storage, new_storage)
-                labs_changed = labs_count != self.state.metrics.labs_count
-                version_changed = cml_version != self.state.metrics.version
-
                 # Check for license changes
                 license_changed = False
                 if license_info:
@@ -1080,15 +1098,40 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
                     if current_licensed != new_licensed:
                         health_changed = True
 
-                emit_event = (
-                    labs_changed
-                    or version_changed
-                    or license_changed
-                    or health_changed
-                    or cpu_delta >= change_threshold_percent
-                    or mem_delta >= change_threshold_percent
-                    or storage_delta >= change_threshold_percent
-                )
+                if not (license_changed or health_changed):
+                    prev_metrics = self.state.metrics
+                    prev_cpu, prev_mem, prev_storage = prev_metrics.get_utilization()
+
+                    # Read the top-level scalars straight from the payload; only build a temporary metrics
+                    # object (per-compute fallback in get_utilization) when none of them is present
+                    new_utilization = direct_utilization(
+                        system_info.get("all_cpu_percent"),
+                        system_info.get("all_memory_total"),
+                        system_info.get("all_memory_used"),
+                        system_info.get("all_disk_total"),
+                        system_info.get("all_disk_used"),
+                    )
+                    if new_utilization is None:
+                        temp_metrics = CMLMetrics(
+                            system_info=CMLSystemInfo(
+                                cpu_utilization=system_info.get("all_cpu_percent"),
+                                memory_total=system_info.get("all_memory_total"),
+                                memory_used=system_info.get("all_memory_used"),
+                                disk_total=system_info.get("all_disk_total"),
+                                disk_used=system_info.get("all_disk_used"),
+                                running_nodes=system_info.get("running_nodes"),
+                                total_nodes=system_info.get("total_nodes"),
+                                computes=system_info.get("computes", {}),
+                            )
+                        )
+                        new_utilization = temp_metrics.get_utilization()
+                    new_cpu, new_mem, new_storage = new_utilization
+
+                    emit_event = (
+                        _pct_changed(prev_cpu, new_cpu) >= change_threshold_percent
+                        or _pct_changed(prev_mem, new_mem) >= change_threshold_percent
+                        or _pct_changed(prev_storage, new_storage) >= change_threshold_percent
+                    )
             except Exception:
                 # Fail open: emit event if derivation fails
                 emit_event = True
@@ -1096,6 +1139,7 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
         if not emit_event:
             return
 
+        now = datetime.now(timezone.utc)
         self.state.on(
             self.register_event(  # type: ignore
                 CMLMetricsUpdatedDomainEvent(
@@ -1107,8 +1151,8 @@ class CMLWorker(AggregateRoot[CMLWorkerState, str]):
                     ready=ready,
                     uptime_seconds=uptime_seconds,
                     labs_count=labs_count,
-                    synced_at=synced_at or datetime.now(timezone.utc),
-                    updated_at=datetime.now(timezone.utc),
+                    synced_at=synced_at or now,
+                    updated_at=now,
                 )
             )
         )
@@ -5,6 +5,53 @@ from datetime import datetime
 from typing import Any
 
 
+def _as_float(value: Any) -> float | None:
+    """Convert a raw CML stats value to float, or None when it is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _used_percent(total: Any, *, used: Any = None, free: Any = None) -> float | None:
+    """Percentage of ``total`` in use, from either ``used`` or ``free``; None if not computable."""
+    total_value = _as_float(total)
+    if total_value is None or total_value <= 0:
+        return None
+    if used is not None:
+        used_value = _as_float(used)
+    else:
+        free_value = _as_float(free)
+        used_value = None if free_value is None else total_value - free_value
+    if used_value is None:
+        return None
+    return (used_value / total_value) * 100
+
+
+def direct_utilization(
+    cpu_percent: float | None,
+    memory_total: int | None,
+    memory_used: int | None,
+    disk_total: int | None,
+    disk_used: int | None,
+) -> tuple[float | None, float | None, float | None] | None:
+    """Derive (cpu, mem, storage) % from CML's aggregate system_info fields.
+
+    Returns None when none of them is available, i.e. when the per-compute stats are needed instead.
+    """
+    mem_util = None
+    if memory_total and memory_used and memory_total > 0:
+        mem_util = (memory_used / memory_total) * 100
+
+    storage_util = None
+    if disk_total and disk_used and disk_total > 0:
+        storage_util = (disk_used / disk_total) * 100
+
+    if cpu_percent is None and mem_util is None and storage_util is None:
+        return None
+    return cpu_percent, mem_util, storage_util
+
+
 @dataclass(frozen=True)
 class CpuStats:
     """Value Object for CPU statistics."""
@@ -123,23 +170,26 @@ class CMLMetrics:
     def get_utilization(self) -> tuple[float | None, float | None, float | None]:
         """Calculate CPU, memory, and storage utilization.
 
+        The result is memoized on the (frozen) instance under a private key, which JsonSerializer skips.
+
         Returns:
             Tuple of (cpu_util, mem_util, storage_util) percentages or None.
         """
+        utilization = self.__dict__.get("_utilization")
+        if utilization is None:
+            utilization = self._compute_utilization()
+            object.__setattr__(self, "_utilization", utilization)
+        return utilization
+
+    def _compute_utilization(self) -> tuple[float | None, float | None, float | None]:
         # 1. Try direct fields from system_info first
         if self.system_info:
-            cpu_util = self.system_info.cpu_utilization
-            mem_util = None
-            storage_util = None
-
-            if self.system_info.memory_total and self.system_info.memory_used and self.system_info.memory_total > 0:
-                mem_util = (self.system_info.memory_used / self.system_info.memory_total) * 100
-
-            if self.system_info.disk_total and self.system_info.disk_used and self.system_info.disk_total > 0:
-                storage_util = (self.system_info.disk_used / self.system_info.disk_total) * 100
-
-            if cpu_util is not None or mem_util is not None or storage_util is not None:
-                return cpu_util, mem_util, storage_util
+            info = self.system_info
+            utilization = direct_utilization(
+                info.cpu_utilization, info.memory_total, info.memory_used, info.disk_total, info.disk_used
+            )
+            if utilization is not None:
+                return utilization
 
         # 2. Fallback to parsing nested stats in system_info.computes
         if not self.system_info:
@@ -190,55 +240,25 @@ class CMLMetrics:
         if "percent" in cpu_stats:
             cpu_util = float(cpu_stats["percent"])
         elif "user_percent" in cpu_stats and "system_percent" in cpu_stats:
-            try:
-                cpu_util = float(cpu_stats["user_percent"]) + float(cpu_stats["system_percent"])
-            except (ValueError, TypeError):
-                pass
+            user = _as_float(cpu_stats["user_percent"])
+            system = _as_float(cpu_stats["system_percent"])
+            if user is not None and system is not None:
+                cpu_util = user + system
 
         # Memory
         mem_stats = stats.get("memory", {})
         if "total" in mem_stats and "used" in mem_stats:
-            try:
-                total = float(mem_stats["total"])
-                used = float(mem_stats["used"])
-                if total > 0:
-                    mem_util = (used / total) * 100
-            except (ValueError, TypeError):
-                pass
+            mem_util = _used_percent(mem_stats["total"], used=mem_stats["used"])
         elif "total" in mem_stats and "free" in mem_stats:
-            try:
-                total = float(mem_stats["total"])
-                free = float(mem_stats["free"])
-                if total > 0:
-                    mem_util = ((total - free) / total) * 100
-            except (ValueError, TypeError):
-                pass
+            mem_util = _used_percent(mem_stats["total"], free=mem_stats["free"])
         elif "total_kb" in mem_stats and "available_kb" in mem_stats:
-            try:
-                total = float(mem_stats["total_kb"])
-                avail = float(mem_stats["available_kb"])
-                if total > 0:
-                    mem_util = ((total - avail) / total) * 100
-            except (ValueError, TypeError):
-                pass
+            mem_util = _used_percent(mem_stats["total_kb"], free=mem_stats["available_kb"])
 
         # Storage
         disk_stats = stats.get("disk", {})
         if "total" in disk_stats and "used" in disk_stats:
-            try:
-                total = float(disk_stats["total"])
-                used = float(disk_stats["used"])
-                if total > 0:
-                    storage_util = (used / total) * 100
-            except (ValueError, TypeError):
-                pass
+            storage_util = _used_percent(disk_stats["total"], used=disk_stats["used"])
         elif "capacity_kb" in disk_stats and "size_kb" in disk_stats:
-            try:
-                capacity = float(disk_stats["capacity_kb"])
-                size = float(disk_stats["size_kb"])
-                if capacity > 0:
-                    storage_util = (size / capacity) * 100
-            except (ValueError, TypeError):
-                pass
+            storage_util = _used_percent(disk_stats["capacity_kb"], used=disk_stats["size_kb"])
 
         return cpu_util, mem_util, storage_util
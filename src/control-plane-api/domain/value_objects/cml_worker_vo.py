@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AWSInstanceDetails:
     """Value object representing AWS EC2 instance details."""
 
@@ -28,7 +28,7 @@ class AWSInstanceDetails:
             raise ValueError("region cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CMLEndpoint:
     """Value object representing CML HTTPS endpoint details."""
 
@@ -44,7 +44,7 @@ class CMLEndpoint:
             raise ValueError("https_url must start with https:// or http://")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkerTelemetry:
     """Value object representing worker telemetry snapshot."""
 
@@ -59,12 +59,13 @@ class WorkerTelemetry:
         """Validate telemetry values."""
         if self.active_labs_count < 0:
             raise ValueError("active_labs_count cannot be negative")
-        if self.cpu_utilization is not None and not 0 <= self.cpu_utilization <= 100:
-            raise ValueError("cpu_utilization must be between 0 and 100")
-        if self.memory_utilization is not None and not 0 <= self.memory_utilization <= 100:
-            raise ValueError("memory_utilization must be between 0 and 100")
-        if self.disk_utilization is not None and not 0 <= self.disk_utilization <= 100:
-            raise ValueError("disk_utilization must be between 0 and 100")
+        for field_name, value in (
+            ("cpu_utilization", self.cpu_utilization),
+            ("memory_utilization", self.memory_utilization),
+            ("disk_utilization", self.disk_utilization),
+        ):
+            if value is not None and not 0 <= value <= 100:
+                raise ValueError(f"{field_name} must be between 0 and 100")
 
     def is_idle(self) -> bool:
         """Check if the worker appears to be idle based on telemetry."""
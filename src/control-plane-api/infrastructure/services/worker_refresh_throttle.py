@@ -5,6 +5,8 @@ excessive refresh requests from overwhelming the backend.
 """
 
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
@@ -21,14 +23,20 @@ class WorkerRefreshThrottle:
     refresh time for each worker and rejecting requests that occur too soon.
     """
 
-    def __init__(self, min_interval_seconds: int = 10):
+    def __init__(self, min_interval_seconds: int = 10, max_entries: int = 10000, max_age_hours: int = 24):
         """Initialize the throttle service.
 
         Args:
             min_interval_seconds: Minimum seconds between refresh requests
+            max_entries: Maximum number of workers tracked; the least recently refreshed are evicted first
+            max_age_hours: Entries older than this are dropped as new refreshes are recorded
         """
-        self._min_interval = timedelta(seconds=min_interval_seconds)
-        self._last_refresh: dict[str, datetime] = {}
+        self._min_interval_sec = float(min_interval_seconds)
+        self._max_entries = max_entries
+        self._max_age_hours = max_age_hours
+        # worker_id -> time.monotonic() of the last refresh (elapsed-time checks only; immune to clock jumps).
+        # Kept ordered oldest-first so cleanup can stop at the first fresh entry.
+        self._last_refresh: OrderedDict[str, float] = OrderedDict()
         log.info(f"WorkerRefreshThrottle initialized with {min_interval_seconds}s min interval")
 
     @staticmethod
@@ -47,40 +55,50 @@ class WorkerRefreshThrottle:
         builder.services.add_singleton(WorkerRefreshThrottle, singleton=instance)
         log.info("✅ WorkerRefreshThrottle configured as singleton")
 
-    def can_refresh(self, worker_id: str) -> bool:
+    def can_refresh(self, worker_id: str, *, now: float | None = None) -> bool:
         """Check if a worker can be refreshed based on throttle rules.
 
         Args:
             worker_id: Worker UUID
+            now: Optional ``time.monotonic()`` value; batch callers can take it once and reuse it
 
         Returns:
             True if refresh is allowed, False if throttled
         """
-        now = datetime.now(timezone.utc)
         last_refresh = self._last_refresh.get(worker_id)
 
         if last_refresh is None:
             # Never refreshed before - allow
             return True
 
-        time_since_last = now - last_refresh
-        can_refresh = time_since_last >= self._min_interval
+        time_since_last = (time.monotonic() if now is None else now) - last_refresh
+        can_refresh = time_since_last >= self._min_interval_sec
 
         if not can_refresh:
-            remaining = self._min_interval - time_since_last
-            log.debug(f"Worker {worker_id} refresh throttled - " f"{remaining.total_seconds():.1f}s remaining")
+            log.debug(
+                "Worker %s refresh throttled - %.1fs remaining", worker_id, self._min_interval_sec - time_since_last
+            )
 
         return can_refresh
 
-    def record_refresh(self, worker_id: str) -> None:
+    def record_refresh(self, worker_id: str, *, now: float | None = None) -> None:
         """Record that a worker was just refreshed.
 
         Args:
             worker_id: Worker UUID
+            now: Optional ``time.monotonic()`` value; batch callers can take it once and reuse it
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = time.monotonic()
+        # Re-insert so the most recent refresh is always at the end
+        self._last_refresh.pop(worker_id, None)
         self._last_refresh[worker_id] = now
-        log.debug(f"Recorded refresh for worker {worker_id} at {now.isoformat()}")
+        log.debug("Recorded refresh for worker %s", worker_id)
+
+        # Keep memory bounded without relying on an external sweep
+        self.cleanup_old_entries(self._max_age_hours, now=now)
+        while len(self._last_refresh) > self._max_entries:
+            self._last_refresh.popitem(last=False)
 
     def get_last_refresh(self, worker_id: str) -> datetime | None:
         """Get the timestamp of the last refresh for a worker.
@@ -91,13 +109,18 @@ class WorkerRefreshThrottle:
         Returns:
             datetime of last refresh, or None if never refreshed
         """
-        return self._last_refresh.get(worker_id)
+        last_refresh = self._last_refresh.get(worker_id)
+        if last_refresh is None:
+            return None
+        # Derived from the monotonic elapsed time; only this accessor needs a wall-clock value
+        return datetime.now(timezone.utc) - timedelta(seconds=time.monotonic() - last_refresh)
 
-    def get_time_until_next_refresh(self, worker_id: str) -> float | None:
+    def get_time_until_next_refresh(self, worker_id: str, *, now: float | None = None) -> float | None:
         """Get seconds until next refresh is allowed.
 
         Args:
             worker_id: Worker UUID
+            now: Optional ``time.monotonic()`` value; batch callers can take it once and reuse it
 
         Returns:
             Seconds until next refresh allowed, or None if can refresh now
@@ -106,35 +129,37 @@ class WorkerRefreshThrottle:
         if last_refresh is None:
             return None
 
-        now = datetime.now(timezone.utc)
-        time_since_last = now - last_refresh
+        time_since_last = (time.monotonic() if now is None else now) - last_refresh
 
-        if time_since_last >= self._min_interval:
+        if time_since_last >= self._min_interval_sec:
             return None
 
-        remaining = self._min_interval - time_since_last
-        return remaining.total_seconds()
+        return self._min_interval_sec - time_since_last
 
-    def cleanup_old_entries(self, max_age_hours: int = 24) -> int:
+    def cleanup_old_entries(self, max_age_hours: int = 24, *, now: float | None = None) -> int:
         """Remove entries older than max_age to prevent unbounded memory growth.
 
         Args:
             max_age_hours: Maximum age in hours before entry is removed
+            now: Optional ``time.monotonic()`` value; batch callers can take it once and reuse it
 
         Returns:
             Number of entries removed
         """
-        now = datetime.now(timezone.utc)
-        max_age = timedelta(hours=max_age_hours)
-
-        old_entries = [
-            worker_id for worker_id, last_refresh in self._last_refresh.items() if now - last_refresh > max_age
-        ]
-
-        for worker_id in old_entries:
-            del self._last_refresh[worker_id]
-
-        if old_entries:
-            log.info(f"Cleaned up {len(old_entries)} throttle entries older than {max_age_hours}h")
-
-        return len(old_entries)
+        if now is None:
+            now = time.monotonic()
+        max_age_sec = max_age_hours * 3600
+
+        # Entries are ordered by refresh time, so only the expired prefix is visited
+        removed = 0
+        while self._last_refresh:
+            last_refresh = next(iter(self._last_refresh.values()))
+            if now - last_refresh <= max_age_sec:
+                break
+            self._last_refresh.popitem(last=False)
+            removed += 1
+
+        if removed:
+            log.info(f"Cleaned up {removed} throttle entries older than {max_age_hours}h")
+
+        return removed
@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class AwsRegion(str, Enum):
+class AwsRegion(StrEnum):
     # NB: add all required regions and corresponding CML Worker AMI_ID in ENV_VARS!
 
     US_EAST_1 = "us-east-1"  # Virginia
@@ -1,9 +1,9 @@
 import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Union
 
 
-class Ec2InstanceStatus(str, Enum):
+class Ec2InstanceStatus(StrEnum):
     PENDING = "PENDING"
     READY = "READY"
     BUSY = "BUSY"
@@ -11,7 +11,7 @@ class Ec2InstanceStatus(str, Enum):
     COMPLETED = "COMPLETED"
 
 
-class Ec2InstanceType(str, Enum):
+class Ec2InstanceType(StrEnum):
     MICRO = "t3.micro"
     SMALL = "t3.small"
     MEDIUM = "t3.medium"
@@ -28,9 +28,21 @@ class Ec2InstanceResourcesUtilizationRelativeStartTime(Enum):
     @classmethod
     def to_timedelta(cls, value: Union[str, "Ec2InstanceResourcesUtilizationRelativeStartTime"]) -> datetime.timedelta:
         """Converts the enum value to a timedelta object."""
-        if isinstance(value, cls):
-            value = value.value
-        time_dict = {"s": 1, "m": 60}
-        unit = value[-1]  # type: ignore[index]
-        delta = int(value[:-1]) * time_dict[unit]  # type: ignore[index]
-        return datetime.timedelta(seconds=delta)
+        member = value if isinstance(value, cls) else cls._value2member_map_.get(value)
+        if member is not None:
+            return _RELATIVE_START_TIMEDELTAS[member]
+        # Not one of the members: parse the raw string as before
+        return _parse_relative_time(value)  # type: ignore[arg-type]
+
+
+def _parse_relative_time(value: str) -> datetime.timedelta:
+    time_dict = {"s": 1, "m": 60}
+    unit = value[-1]
+    delta = int(value[:-1]) * time_dict[unit]
+    return datetime.timedelta(seconds=delta)
+
+
+# Precomputed once; to_timedelta is a dict lookup for every member
+_RELATIVE_START_TIMEDELTAS: dict[Ec2InstanceResourcesUtilizationRelativeStartTime, datetime.timedelta] = {
+    member: _parse_relative_time(member.value) for member in Ec2InstanceResourcesUtilizationRelativeStartTime
+}
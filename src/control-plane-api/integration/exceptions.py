@@ -1,3 +1,7 @@
+from enum import IntEnum
+from typing import ClassVar
+
+
 class IntegrationException(Exception):
     """Base exception for integration layer errors."""
 
@@ -7,55 +11,69 @@ class IntegrationException(Exception):
 # AWS EC2 Specific Exceptions
 
 
+class EC2ErrorCode(IntEnum):
+    """Error code carried by every EC2 exception, for dispatch without matching on subclasses."""
+
+    UNKNOWN = 0
+    INSTANCE_NOT_FOUND = 1
+    INSTANCE_CREATION_FAILED = 2
+    INSTANCE_OPERATION_FAILED = 3
+    TAG_OPERATION_FAILED = 4
+    STATUS_CHECK_FAILED = 5
+    AUTHENTICATION_FAILED = 6
+    QUOTA_EXCEEDED = 7
+    INVALID_PARAMETER = 8
+
+
 class EC2Exception(IntegrationException):
     """Base exception for AWS EC2 related errors."""
 
-    pass
+    code: ClassVar[EC2ErrorCode] = EC2ErrorCode.UNKNOWN
 
 
 class EC2InstanceNotFoundException(EC2Exception):
     """Raised when an EC2 instance is not found."""
 
-    pass
+    code = EC2ErrorCode.INSTANCE_NOT_FOUND
 
 
 class EC2InstanceCreationException(EC2Exception):
     """Raised when EC2 instance creation fails."""
 
-    pass
+    code = EC2ErrorCode.INSTANCE_CREATION_FAILED
 
 
 class EC2InstanceOperationException(EC2Exception):
     """Raised when an EC2 instance operation (start/stop/terminate) fails."""
 
-    pass
+    code = EC2ErrorCode.INSTANCE_OPERATION_FAILED
 
 
 class EC2TagOperationException(EC2Exception):
     """Raised when an EC2 tag operation fails."""
 
-    pass
+    code = EC2ErrorCode.TAG_OPERATION_FAILED
 
 
 class EC2StatusCheckException(EC2Exception):
     """Raised when retrieving EC2 status checks fails."""
 
-    pass
+    code = EC2ErrorCode.STATUS_CHECK_FAILED
 
 
 class EC2AuthenticationException(EC2Exception):
     """Raised when AWS credentials are invalid or insufficient permissions."""
 
-    pass
+    code = EC2ErrorCode.AUTHENTICATION_FAILED
 
 
 class EC2QuotaExceededException(EC2Exception):
     """Raised when AWS resource quota/limit is exceeded."""
 
-    pass
+    code = EC2ErrorCode.QUOTA_EXCEEDED
 
 
 class EC2InvalidParameterException(EC2Exception):
     """Raised when invalid parameters are provided to AWS API."""
 
-    pass
+    code = EC2ErrorCode.INVALID_PARAMETER
@@ -168,12 +168,12 @@ class AwsEc2Client:
         """
         return await self._run_async(self._health_sync)
 
-    def _get_ami_ids_by_name_sync(
+    def _get_amis_by_name_sync(
         self,
         aws_region: AwsRegion,
         ami_name: str,
-    ) -> list[str]:
-        """Query AWS to find AMI IDs that match the given AMI name (Synchronous)."""
+    ) -> list[AmiDetails]:
+        """Query AWS to find AMIs (with their details) that match the given AMI name (Synchronous)."""
         try:
             ec2_client = boto3.client(
                 "ec2",
@@ -188,16 +188,25 @@ class AwsEc2Client:
                 Filters=[{"Name": "name", "Values": [f"*{ami_name}*"]}]  # Wildcard search
             )
 
-            ami_ids = [image["ImageId"] for image in response.get("Images", [])]
+            amis = [
+                AmiDetails(
+                    ami_id=image["ImageId"],
+                    ami_name=image.get("Name"),
+                    ami_description=image.get("Description"),
+                    ami_creation_date=image.get("CreationDate"),
+                )
+                for image in response.get("Images", [])
+            ]
 
-            if ami_ids:
+            if amis:
                 log.info(
-                    f"Found {len(ami_ids)} AMI(s) matching name pattern '{ami_name}' in {aws_region.value}: {ami_ids}"
+                    f"Found {len(amis)} AMI(s) matching name pattern '{ami_name}' in {aws_region.value}: "
+                    f"{[ami.ami_id for ami in amis]}"
                 )
             else:
                 log.warning(f"No AMIs found matching name pattern '{ami_name}' in {aws_region.value}")
 
-            return ami_ids
+            return amis
 
         except ClientError as e:
             error = self._parse_aws_error(e, f"Query AMIs by name '{ami_name}'")
@@ -207,6 +216,28 @@ class AwsEc2Client:
             log.error(f"Invalid parameters for AMI query: {e}")
             raise EC2InvalidParameterException(f"Invalid AMI name parameter: {e}")
 
+    async def get_amis_by_name(
+        self,
+        aws_region: AwsRegion,
+        ami_name: str,
+    ) -> list[AmiDetails]:
+        """Query AWS to find AMIs that match the given AMI name, including their details.
+
+        Use this instead of get_ami_ids_by_name() followed by get_ami_details() to save
+        a describe_images round-trip.
+
+        Args:
+            aws_region: The AWS region to search in.
+            ami_name: The AMI name pattern to search for.
+
+        Returns:
+            List of AmiDetails for the AMIs that match the name pattern.
+
+        Raises:
+            IntegrationException: If the AMI query fails.
+        """
+        return await self._run_async(self._get_amis_by_name_sync, aws_region, ami_name)
+
     async def get_ami_ids_by_name(
         self,
         aws_region: AwsRegion,
@@ -224,7 +255,8 @@ class AwsEc2Client:
         Raises:
             IntegrationException: If the AMI query fails.
         """
-        return await self._run_async(self._get_ami_ids_by_name_sync, aws_region, ami_name)
+        amis = await self.get_amis_by_name(aws_region, ami_name)
+        return [ami.ami_id for ami in amis]
 
     def _get_ami_details_sync(self, aws_region: AwsRegion, ami_id: str) -> AmiDetails | None:
         """Get AMI details from AWS by AMI ID (Synchronous)."""
@@ -975,7 +1007,7 @@ class AwsEc2Client:
             )
 
             now = datetime.datetime.now(datetime.timezone.utc)
-            start_time = now - Ec2InstanceResourcesUtilizationRelativeStartTime.to_timedelta(relative_start_time.value)
+            start_time = now - Ec2InstanceResourcesUtilizationRelativeStartTime.to_timedelta(relative_start_time)
 
             # CPU Utilization (available by default in AWS/EC2)
             cpu_metric = cloudwatch.get_metric_statistics(
@@ -7,10 +7,13 @@ API Documentation: https://developer.cisco.com/docs/modeling-labs/
 """
 
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import httpx
+from neuroglia.hosting.abstractions import HostedService
 
 from integration.exceptions import IntegrationException
 
@@ -269,6 +272,7 @@ class CMLApiClient:
         password: str,
         verify_ssl: bool = True,
         timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """Initialize CML API client.
 
@@ -278,6 +282,7 @@ class CMLApiClient:
             password: CML API password
             verify_ssl: Whether to verify SSL certificates
             timeout: Request timeout in seconds
+            http_client: Shared pooled HTTP client (owned by the caller, never closed here)
         """
         self.base_url = base_url.rstrip("/")
         self.username = username
@@ -285,6 +290,23 @@ class CMLApiClient:
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         self._token: str | None = None
+        self._http_client = http_client
+
+    @asynccontextmanager
+    async def _client(self, timeout: float | None = None) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client, or a short-lived one when none matches the requested settings.
+
+        Args:
+            timeout: Request timeout override in seconds (defaults to the client timeout)
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        shared = self._http_client
+        if shared is not None and not shared.is_closed and shared.timeout == httpx.Timeout(timeout):
+            yield shared
+            return
+
+        async with httpx.AsyncClient(verify=self.verify_ssl, timeout=timeout) as client:
+            yield client
 
     async def _authenticate(self) -> str:
         """Authenticate and get JWT token.
@@ -298,7 +320,7 @@ class CMLApiClient:
         auth_url = f"{self.base_url}/api/v0/authenticate"
 
         try:
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
                     auth_url,
                     json={"username": self.username, "password": self.password},
@@ -357,7 +379,7 @@ class CMLApiClient:
             # Get JWT token
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -413,7 +435,7 @@ class CMLApiClient:
             # Get JWT token
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -466,7 +488,7 @@ class CMLApiClient:
         endpoint = f"{self.base_url}/api/v0/system_information"
 
         try:
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(endpoint)
 
                 if response.status_code == 404:
@@ -525,7 +547,7 @@ class CMLApiClient:
             # Get JWT token
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(
                     endpoint,
                     headers={"Authorization": f"Bearer {token}"},
@@ -600,7 +622,7 @@ class CMLApiClient:
             # Get JWT token
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -657,7 +679,7 @@ class CMLApiClient:
             # Get JWT token
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -721,7 +743,7 @@ class CMLApiClient:
         try:
             auth_token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=30.0) as client:
+            async with self._client(timeout=30.0) as client:
                 response = await client.post(
                     endpoint,
                     headers={"Authorization": f"Bearer {auth_token}"},
@@ -781,7 +803,7 @@ class CMLApiClient:
         try:
             auth_token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=60.0) as client:
+            async with self._client(timeout=60.0) as client:
                 response = await client.delete(endpoint, headers={"Authorization": f"Bearer {auth_token}"})
 
                 if response.status_code == 204:
@@ -837,7 +859,7 @@ class CMLApiClient:
         try:
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.put(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -875,7 +897,7 @@ class CMLApiClient:
         try:
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.put(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -913,7 +935,7 @@ class CMLApiClient:
         try:
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.put(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -946,27 +968,51 @@ class CMLApiClient:
         Raises:
             IntegrationException: On API errors
         """
-        endpoint = f"{self.base_url}/api/v0/labs/{lab_id}/download"
+        content = bytearray()
+        async for chunk in self.download_lab_stream(lab_id):
+            content.extend(chunk)
 
-        try:
-            token = await self._get_token()
+        log.info(f"Successfully downloaded lab {lab_id}")
+        return content.decode("utf-8")
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
-                response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
+    async def download_lab_stream(self, lab_id: str) -> AsyncGenerator[bytes, None]:
+        """Stream lab topology YAML without buffering the whole payload.
 
-                if response.status_code == 401:
-                    # Token expired, re-authenticate
-                    log.info("Token expired, re-authenticating")
-                    self._token = None
-                    token = await self._get_token()
-                    response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
+        Consume the generator fully or ``aclose()`` it; the upstream response stays open until then.
 
-                if response.status_code != 200:
-                    log.error(f"Failed to download lab {lab_id}: {response.status_code} {response.text}")
-                    raise IntegrationException(f"Failed to download lab: HTTP {response.status_code}")
+        Args:
+            lab_id: Lab identifier
+
+        Yields:
+            Raw YAML bytes as received from the CML API
+
+        Raises:
+            IntegrationException: On API errors
+        """
+        endpoint = f"{self.base_url}/api/v0/labs/{lab_id}/download"
+
+        try:
+            token = await self._get_token()
 
-                log.info(f"Successfully downloaded lab {lab_id}")
-                return response.text
+            async with self._client() as client:
+                for attempt in range(2):
+                    headers = {"Authorization": f"Bearer {token}"}
+                    async with client.stream("GET", endpoint, headers=headers) as response:
+                        if response.status_code == 401 and attempt == 0:
+                            # Token expired, re-authenticate
+                            log.info("Token expired, re-authenticating")
+                            self._token = None
+                            token = await self._get_token()
+                            continue
+
+                        if response.status_code != 200:
+                            await response.aread()
+                            log.error(f"Failed to download lab {lab_id}: {response.status_code} {response.text}")
+                            raise IntegrationException(f"Failed to download lab: HTTP {response.status_code}")
+
+                        async for chunk in response.aiter_bytes():
+                            yield chunk
+                        return
 
         except Exception as e:
             log.error(f"Error downloading lab {lab_id}: {e}")
@@ -998,7 +1044,7 @@ class CMLApiClient:
                 "Content-Type": "application/json",
             }
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(endpoint, content=yaml_content, headers=headers)
 
                 if response.status_code == 401:
@@ -1038,7 +1084,7 @@ class CMLApiClient:
         try:
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.delete(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -1078,7 +1124,7 @@ class CMLApiClient:
         try:
             token = await self._get_token()
 
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.get(endpoint, headers={"Authorization": f"Bearer {token}"})
 
                 if response.status_code == 401:
@@ -1121,7 +1167,8 @@ class CMLApiClientFactory:
     """Factory for creating CML API client instances.
 
     Provides consistent configuration for CML API clients across the application.
-    Each worker requires its own client instance with specific endpoint and credentials.
+    Each worker requires its own client instance with specific endpoint and credentials,
+    but all of them share pooled HTTP connections (keep-alive) owned by the factory.
     """
 
     def __init__(
@@ -1143,6 +1190,28 @@ class CMLApiClientFactory:
         self.default_password = default_password
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        # Pooled HTTP clients shared by all CMLApiClient instances, keyed by (verify_ssl, timeout)
+        self._http_clients: dict[tuple[bool, float], httpx.AsyncClient] = {}
+
+    def _get_http_client(self, verify_ssl: bool, timeout: float) -> httpx.AsyncClient:
+        """Get (or lazily create) the pooled HTTP client for the given settings."""
+        key = (verify_ssl, timeout)
+        client = self._http_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                verify=verify_ssl,
+                timeout=timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+            self._http_clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close all pooled HTTP clients."""
+        clients = list(self._http_clients.values())
+        self._http_clients.clear()
+        for client in clients:
+            await client.aclose()
 
     def create(
         self,
@@ -1164,12 +1233,15 @@ class CMLApiClientFactory:
         Returns:
             Configured CMLApiClient instance
         """
+        verify_ssl = verify_ssl if verify_ssl is not None else self.verify_ssl
+        timeout = timeout if timeout is not None else self.timeout
         return CMLApiClient(
             base_url=base_url,
             username=username or self.default_username,
             password=password or self.default_password,
-            verify_ssl=verify_ssl if verify_ssl is not None else self.verify_ssl,
-            timeout=timeout if timeout is not None else self.timeout,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            http_client=self._get_http_client(verify_ssl, timeout),
         )
 
     @staticmethod
@@ -1198,4 +1270,22 @@ class CMLApiClientFactory:
 
         # Register as singleton in DI container
         builder.services.add_singleton(CMLApiClientFactory, singleton=factory)
+
+        # Close the pooled HTTP clients when the host stops (the API lifespan stops all hosted services)
+        builder.services.add_singleton(HostedService, singleton=CMLApiClientPoolHostedService(factory))
         log.info("✅ CML API Client Factory registered in DI container")
+
+
+class CMLApiClientPoolHostedService(HostedService):
+    """Hosted service that closes the CML API client factory's pooled HTTP clients on shutdown."""
+
+    def __init__(self, factory: CMLApiClientFactory):
+        self._factory = factory
+
+    async def start_async(self) -> None:
+        """Nothing to start; pooled clients are created lazily."""
+
+    async def stop_async(self) -> None:
+        """Close all pooled HTTP clients."""
+        log.info("Closing pooled CML API HTTP clients")
+        await self._factory.aclose()
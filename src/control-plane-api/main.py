@@ -1,5 +1,6 @@
 """Main application entry point with SubApp mounting."""
 
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -110,6 +111,23 @@ def debug_log_environment(prefix_only: tuple[str, ...] = ("AUTO_IMPORT_",)) -> N
         log.warning("Failed to dump environment variables: %s", ex)
 
 
+def enable_eager_task_factory() -> None:
+    """Run new tasks eagerly until their first suspension point (Python 3.12+).
+
+    uvicorn (factory mode) and background_worker both call create_app() from inside the running loop,
+    so the factory is installed on the loop that serves the application. No-op otherwise.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    loop.set_task_factory(eager_task_factory)
+    log.debug("⚡ Eager task factory enabled on the running event loop")
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -124,6 +142,7 @@ def create_app() -> FastAPI:
 
     # Early environment diagnostics before service configuration & scheduler startup
     debug_log_environment()
+    enable_eager_task_factory()
 
     builder = WebApplicationBuilder(app_settings=app_settings)
 
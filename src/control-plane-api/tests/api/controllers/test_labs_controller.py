@@ -0,0 +1,77 @@
+"""Tests for the labs controller's streaming download response."""
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from api.controllers.labs_controller import ClosingStreamingResponse
+
+_SCOPE = {"type": "http", "asgi": {"spec_version": "2.4"}}
+
+
+class _Body:
+    """Async iterator body that records whether it was closed."""
+
+    def __init__(self, chunks: list[bytes], error: Exception | None = None):
+        self._chunks = iter(chunks)
+        self._error = error
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        chunk = next(self._chunks, None)
+        if chunk is not None:
+            return chunk
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def _receive() -> dict:
+    return {"type": "http.disconnect"}
+
+
+class TestClosingStreamingResponse:
+    """Test that the download response always releases its body stream."""
+
+    async def test_closes_body_after_complete_response(self):
+        body = _Body([b"lab:\n", b"  title: demo\n"])
+        sent: list[dict] = []
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        await ClosingStreamingResponse(content=body, media_type="text/yaml")(_SCOPE, _receive, send)
+
+        assert b"".join(message.get("body", b"") for message in sent) == b"lab:\n  title: demo\n"
+        assert body.closed
+
+    async def test_closes_body_when_client_disconnects(self):
+        body = _Body([b"first", b"second"])
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.body":
+                raise OSError("client went away")
+
+        with pytest.raises(ClientDisconnect):
+            await ClosingStreamingResponse(content=body, media_type="text/yaml")(_SCOPE, _receive, send)
+
+        assert body.closed
+
+    async def test_mid_stream_error_aborts_without_completing_the_response(self):
+        body = _Body([b"first"], error=RuntimeError("upstream failed"))
+        sent: list[dict] = []
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        with pytest.raises(RuntimeError, match="upstream failed"):
+            await ClosingStreamingResponse(content=body, media_type="text/yaml")(_SCOPE, _receive, send)
+
+        # The final (more_body=False) message is never sent, so the client sees an incomplete transfer
+        assert all(message.get("more_body", True) for message in sent if message["type"] == "http.response.body")
+        assert body.closed
@@ -0,0 +1,90 @@
+"""Tests for the retry_on_concurrency_conflict decorator."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from neuroglia.data.exceptions import OptimisticConcurrencyException
+
+from application.decorators import retry_on_concurrency_conflict
+
+
+def _conflict() -> OptimisticConcurrencyException:
+    return OptimisticConcurrencyException("worker-1", expected_version=1, actual_version=2)
+
+
+def _failing(failures: int) -> AsyncMock:
+    """Operation that raises a concurrency conflict `failures` times, then succeeds."""
+    return AsyncMock(side_effect=[_conflict() for _ in range(failures)] + ["done"])
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("application.decorators.retry.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+class TestRetryOnConcurrencyConflict:
+    """Test retry attempts and the backoff delay sequence."""
+
+    async def test_returns_without_retry_on_success(self, mock_sleep):
+        operation = _failing(0)
+
+        assert await retry_on_concurrency_conflict()(operation)() == "done"
+        assert operation.await_count == 1
+        mock_sleep.assert_not_called()
+
+    async def test_first_retry_is_immediate(self, mock_sleep):
+        operation = _failing(1)
+
+        assert await retry_on_concurrency_conflict(max_attempts=3)(operation)() == "done"
+        assert operation.await_count == 2
+        mock_sleep.assert_not_called()
+
+    async def test_later_retries_use_jittered_delay_within_bounds(self, mock_sleep):
+        operation = _failing(2)
+
+        decorated = retry_on_concurrency_conflict(max_attempts=3, initial_delay=0.1, backoff_factor=2.0)(operation)
+
+        assert await decorated() == "done"
+        mock_sleep.assert_awaited_once()
+        delay = mock_sleep.await_args.args[0]
+        assert 0.1 <= delay <= 0.2
+
+    async def test_delay_sequence_grows_by_backoff_factor_up_to_max_delay(self, mock_sleep):
+        operation = _failing(5)
+        decorated = retry_on_concurrency_conflict(max_attempts=6, initial_delay=0.1, backoff_factor=2.0, max_delay=0.3)
+
+        # Always pick the top of the jitter range to make the sequence deterministic
+        with patch("application.decorators.retry.random.uniform", side_effect=lambda low, high: high):
+            assert await decorated(operation)() == "done"
+
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert delays == pytest.approx([0.2, 0.3, 0.3, 0.3])
+
+    async def test_delays_never_exceed_max_delay(self, mock_sleep):
+        operation = _failing(19)
+        decorated = retry_on_concurrency_conflict(max_attempts=20, initial_delay=0.1, backoff_factor=3.0, max_delay=0.5)
+
+        assert await decorated(operation)() == "done"
+
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(delays) == 18  # Every retry but the first sleeps
+        assert all(0.1 <= delay <= 0.5 for delay in delays)
+
+    async def test_reraises_after_max_attempts(self, mock_sleep):
+        operation = _failing(3)
+
+        with pytest.raises(OptimisticConcurrencyException):
+            await retry_on_concurrency_conflict(max_attempts=3)(operation)()
+
+        assert operation.await_count == 3
+        assert mock_sleep.await_count == 1
+
+    async def test_other_exceptions_are_not_retried(self, mock_sleep):
+        operation = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(ValueError):
+            await retry_on_concurrency_conflict()(operation)()
+
+        assert operation.await_count == 1
+        mock_sleep.assert_not_called()
@@ -1,17 +1,38 @@
 """Tests for bulk import CML Workers command."""
 
+import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from application.commands import (BulkImportCMLWorkersCommand,
                                   BulkImportCMLWorkersCommandHandler, BulkImportResult)
+from domain.entities.cml_worker import CMLWorker
 from integration.services.aws_ec2_api_client import AmiDetails, Ec2InstanceDescriptor
 
-# from tests.fixtures.factories import CMLWorkerFactory
+# The launch time is never asserted on, so every descriptor shares one fixed timestamp
+_FIXED_LAUNCH_TS = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+_DEFAULT_AMI = AmiDetails(
+    ami_id="ami-0abc123def456",
+    ami_name="test-ami",
+    ami_description="Test AMI",
+    ami_creation_date="2024-01-01T00:00:00.000Z",
+)
+
+# Already registered workers, built once; the handler only reads them for "running" instances
+_EXISTING_WORKERS = {
+    "i-002": CMLWorker.import_from_existing_instance(
+        name="worker-02",
+        aws_region="us-west-2",
+        aws_instance_id="i-002",
+        instance_type="m5.xlarge",
+        ami_id="ami-0abc123def456",
+        instance_state="running",
+    ),
+}
 
 
-@pytest.mark.asyncio
 class TestBulkImportCMLWorkersCommand:
     """Test suite for bulk import CML Workers command."""
 
@@ -50,97 +71,47 @@ class TestBulkImportCMLWorkersCommand:
 
     def create_mock_instance_descriptor(self, instance_id: str, name: str = None) -> Ec2InstanceDescriptor:
         """Create a mock EC2 instance descriptor."""
-        import datetime
-
         return Ec2InstanceDescriptor(
             id=instance_id,
             type="m5.xlarge",
             state="running",
             image_id="ami-0abc123def456",
             name=name or f"instance-{instance_id}",
-            launch_timestamp=datetime.datetime.now(),
+            launch_timestamp=_FIXED_LAUNCH_TS,
             launch_time_relative="2 hours ago",
             public_ip="1.2.3.4",
             private_ip="10.0.1.10",
         )
 
-    async def test_bulk_import_all_new_instances(self, mock_dependencies):
-        """Test bulk import when all instances are new (not registered)."""
+    @pytest.mark.parametrize(
+        "instance_count, existing_ids, expected_imported, expected_skipped",
+        [
+            (3, [], 3, 0),
+            (3, ["i-002"], 2, 1),
+            (0, [], 0, 0),
+        ],
+        ids=["all_new", "skip_existing", "none_found"],
+    )
+    async def test_bulk_import(
+        self, mock_dependencies, instance_count, existing_ids, expected_imported, expected_skipped
+    ):
+        """Test bulk import imports new instances and skips already registered ones."""
         handler = self.create_handler(mock_dependencies)
 
-        # Mock AWS client to return 3 instances
+        # Mock AWS client to return the matching instances
         mock_instances = [
-            self.create_mock_instance_descriptor("i-001", "worker-01"),
-            self.create_mock_instance_descriptor("i-002", "worker-02"),
-            self.create_mock_instance_descriptor("i-003", "worker-03"),
+            self.create_mock_instance_descriptor(f"i-{i:03d}", f"worker-{i:02d}") for i in range(1, instance_count + 1)
         ]
         mock_dependencies["aws_ec2_client"].get_ami_ids_by_name.return_value = ["ami-0abc123def456"]
         mock_dependencies["aws_ec2_client"].list_instances.return_value = mock_instances
-        mock_dependencies["aws_ec2_client"].get_ami_details.return_value = AmiDetails(
-            ami_id="ami-0abc123def456",
-            ami_name="test-ami",
-            ami_description="Test AMI",
-            ami_creation_date="2024-01-01T00:00:00.000Z",
-        )
-
-        # Mock repository to return no existing workers
-        mock_dependencies["cml_worker_repository"].get_all_async.return_value = []
-
-        # Mock repository add_async to return saved workers
-        async def mock_add_async(worker):
-            return worker
-
-        mock_dependencies["cml_worker_repository"].add_async.side_effect = mock_add_async
-
-        # Execute command
-        command = BulkImportCMLWorkersCommand(aws_region="us-west-2", ami_name="test-ami", created_by="test-user")
-
-        result = await handler.handle_async(command)
-
-        # Verify success
-        assert result.is_success
-        assert isinstance(result.data, BulkImportResult)
-        assert result.data.total_found == 3
-        assert result.data.total_imported == 3
-        assert result.data.total_skipped == 0
-        assert len(result.data.imported) == 3
-        assert len(result.data.skipped) == 0
-
-        # Verify repository was called 3 times
-        assert mock_dependencies["cml_worker_repository"].add_async.call_count == 3
-
-    @pytest.mark.skip(reason="CMLWorkerFactory not implemented yet")
-    async def test_bulk_import_skip_existing_instances(self, mock_dependencies):
-        """Test bulk import skips instances that are already registered."""
-        handler = self.create_handler(mock_dependencies)
+        mock_dependencies["aws_ec2_client"].get_ami_details.return_value = _DEFAULT_AMI
 
-        # Mock AWS client to return 3 instances
-        mock_instances = [
-            self.create_mock_instance_descriptor("i-001", "worker-01"),
-            self.create_mock_instance_descriptor("i-002", "worker-02"),
-            self.create_mock_instance_descriptor("i-003", "worker-03"),
+        # Mock repository to return the already registered workers
+        mock_dependencies["cml_worker_repository"].get_all_async.return_value = [
+            _EXISTING_WORKERS[instance_id] for instance_id in existing_ids
         ]
-        mock_dependencies["aws_ec2_client"].get_ami_ids_by_name.return_value = ["ami-0abc123def456"]
-        mock_dependencies["aws_ec2_client"].list_instances.return_value = mock_instances
-        mock_dependencies["aws_ec2_client"].get_ami_details.return_value = AmiDetails(
-            ami_id="ami-0abc123def456",
-            ami_name="test-ami",
-            ami_description="Test AMI",
-            ami_creation_date="2024-01-01T00:00:00.000Z",
-        )
 
-        # Mock repository to return 1 existing worker (i-002)
-        # existing_worker = CMLWorkerFactory.import_from_existing(
-        #     name="worker-02",
-        #     aws_region="us-west-2",
-        #     aws_instance_id="i-002",
-        #     instance_type="m5.xlarge",
-        #     ami_id="ami-0abc123def456",
-        #     instance_state="running",
-        # )
-        # mock_dependencies["cml_worker_repository"].get_all_async.return_value = [existing_worker]
-
-        # Mock repository add_async
+        # Mock repository add_async to return saved workers
         async def mock_add_async(worker):
             return worker
 
@@ -154,39 +125,15 @@ class TestBulkImportCMLWorkersCommand:
         # Verify success
         assert result.is_success
         assert isinstance(result.data, BulkImportResult)
-        assert result.data.total_found == 3
-        assert result.data.total_imported == 2
-        assert result.data.total_skipped == 1
-        assert len(result.data.imported) == 2
-        assert len(result.data.skipped) == 1
-        assert result.data.skipped[0]["instance_id"] == "i-002"
-        assert "Already registered" in result.data.skipped[0]["reason"]
-
-        # Verify repository was called only 2 times (skipped i-002)
-        assert mock_dependencies["cml_worker_repository"].add_async.call_count == 2
-
-    async def test_bulk_import_no_instances_found(self, mock_dependencies):
-        """Test bulk import when no instances match criteria."""
-        handler = self.create_handler(mock_dependencies)
-
-        # Mock AWS client to return empty list
-        mock_dependencies["aws_ec2_client"].get_ami_ids_by_name.return_value = ["ami-0abc123def456"]
-        mock_dependencies["aws_ec2_client"].list_instances.return_value = []
-
-        # Execute command
-        command = BulkImportCMLWorkersCommand(aws_region="us-west-2", ami_name="test-ami", created_by="test-user")
-
-        result = await handler.handle_async(command)
-
-        # Verify success with empty result
-        assert result.is_success
-        assert isinstance(result.data, BulkImportResult)
-        assert result.data.total_found == 0
-        assert result.data.total_imported == 0
-        assert result.data.total_skipped == 0
-
-        # Verify repository was never called
-        assert mock_dependencies["cml_worker_repository"].add_async.call_count == 0
+        assert result.data.total_found == instance_count
+        assert result.data.total_imported == expected_imported
+        assert result.data.total_skipped == expected_skipped
+        assert len(result.data.imported) == expected_imported
+        assert [skipped["instance_id"] for skipped in result.data.skipped] == existing_ids
+        assert all("Already registered" in skipped["reason"] for skipped in result.data.skipped)
+
+        # Verify only the new instances were saved
+        assert mock_dependencies["cml_worker_repository"].add_async.call_count == expected_imported
 
     async def test_bulk_import_requires_ami_criteria(self, mock_dependencies):
         """Test bulk import fails without AMI search criteria."""
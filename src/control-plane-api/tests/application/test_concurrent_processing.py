@@ -14,11 +14,16 @@ from application.jobs.worker_metrics_collection_job import WorkerMetricsCollecti
 from domain.entities.cml_worker import CMLWorker
 from domain.enums import CMLWorkerStatus
 from domain.repositories import CMLWorkerRepository
+from domain.repositories.lab_record_repository import LabRecordRepository
+from integration.services.cml_api_client import CMLApiClientFactory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_workers():
-    """Create mock workers for testing."""
+    """Create mock workers for testing.
+
+    The jobs only read from the workers, so the spec'd mocks are built once and shared by the tests in this module.
+    """
     workers = []
     for i in range(15):  # Create 15 workers to test concurrent processing
         worker = MagicMock(spec=CMLWorker)
@@ -31,7 +36,6 @@ def mock_workers():
     return workers
 
 
-@pytest.mark.asyncio
 async def test_worker_metrics_job_uses_concurrent_processing(mock_workers):
     """Test that WorkerMetricsCollectionJob processes workers concurrently with semaphore."""
     # Mock dependencies
@@ -54,9 +58,8 @@ async def test_worker_metrics_job_uses_concurrent_processing(mock_workers):
     }
     mock_mediator.execute_async.return_value = success_result
 
-    mock_scope.get_required_service.side_effect = lambda t: (
-        mock_repository if t == CMLWorkerRepository else mock_mediator
-    )
+    services = {CMLWorkerRepository: mock_repository, Mediator: mock_mediator}
+    mock_scope.get_required_service.side_effect = services.get
 
     # Create job instance
     job = WorkerMetricsCollectionJob()
@@ -66,25 +69,21 @@ async def test_worker_metrics_job_uses_concurrent_processing(mock_workers):
     # Track concurrent execution
     active_count = 0
     max_concurrent = 0
-    lock = asyncio.Lock()
 
     original_execute = mock_mediator.execute_async
 
     async def tracked_execute(*args, **kwargs):
         nonlocal active_count, max_concurrent
-        async with lock:
-            active_count += 1
-            if active_count > max_concurrent:
-                max_concurrent = active_count
-
-        # Simulate some processing time
-        await asyncio.sleep(0.01)
-
-        async with lock:
+        # No await between read and write, so the counters need no lock
+        active_count += 1
+        max_concurrent = max(max_concurrent, active_count)
+        try:
+            # Yield to the event loop so the other tasks get admitted (no wall-clock wait needed)
+            await asyncio.sleep(0)
+            return await original_execute(*args, **kwargs)
+        finally:
             active_count -= 1
 
-        return await original_execute(*args, **kwargs)
-
     mock_mediator.execute_async = tracked_execute
 
     # Execute the job
@@ -102,7 +101,6 @@ async def test_worker_metrics_job_uses_concurrent_processing(mock_workers):
     mock_scope.dispose.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_labs_refresh_job_uses_concurrent_processing(mock_workers):
     """Test that LabsRefreshJob processes workers concurrently with semaphore."""
     # Mock dependencies
@@ -121,19 +119,12 @@ async def test_labs_refresh_job_uses_concurrent_processing(mock_workers):
     mock_cml_client.get_labs.return_value = []
     mock_cml_client_factory.create.return_value = mock_cml_client
 
-    def get_service(service_type):
-        from domain.repositories.lab_record_repository import LabRecordRepository
-        from integration.services.cml_api_client import CMLApiClientFactory
-
-        if service_type == CMLWorkerRepository:
-            return mock_worker_repository
-        elif service_type == LabRecordRepository:
-            return mock_lab_repository
-        elif service_type == CMLApiClientFactory:
-            return mock_cml_client_factory
-        return None
-
-    mock_scope.get_required_service.side_effect = get_service
+    services = {
+        CMLWorkerRepository: mock_worker_repository,
+        LabRecordRepository: mock_lab_repository,
+        CMLApiClientFactory: mock_cml_client_factory,
+    }
+    mock_scope.get_required_service.side_effect = services.get
 
     # Create job instance
     job = LabsRefreshJob()
@@ -142,25 +133,21 @@ async def test_labs_refresh_job_uses_concurrent_processing(mock_workers):
     # Track concurrent execution
     active_count = 0
     max_concurrent = 0
-    lock = asyncio.Lock()
 
     original_get_labs = mock_cml_client.get_labs
 
     async def tracked_get_labs(*args, **kwargs):
         nonlocal active_count, max_concurrent
-        async with lock:
-            active_count += 1
-            if active_count > max_concurrent:
-                max_concurrent = active_count
-
-        # Simulate some processing time
-        await asyncio.sleep(0.01)
-
-        async with lock:
+        # No await between read and write, so the counters need no lock
+        active_count += 1
+        max_concurrent = max(max_concurrent, active_count)
+        try:
+            # Yield to the event loop so the other tasks get admitted (no wall-clock wait needed)
+            await asyncio.sleep(0)
+            return await original_get_labs(*args, **kwargs)
+        finally:
             active_count -= 1
 
-        return await original_get_labs(*args, **kwargs)
-
     mock_cml_client.get_labs = tracked_get_labs
 
     # Execute the job
@@ -178,7 +165,6 @@ async def test_labs_refresh_job_uses_concurrent_processing(mock_workers):
     mock_scope.dispose.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_semaphore_prevents_overload():
     """Test that semaphore actually limits concurrent operations."""
     # Create a semaphore with limit 3
@@ -196,8 +182,8 @@ async def test_semaphore_prevents_overload():
                 if active_count > max_concurrent:
                     max_concurrent = active_count
 
-            # Simulate work
-            await asyncio.sleep(0.05)
+            # Yield so the remaining tasks queue on the semaphore
+            await asyncio.sleep(0)
 
             async with lock:
                 active_count -= 1
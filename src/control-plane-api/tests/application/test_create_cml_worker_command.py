@@ -2,10 +2,6 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from neuroglia.eventing.cloud_events.infrastructure.cloud_event_bus import CloudEventBus
-from neuroglia.eventing.cloud_events.infrastructure.cloud_event_publisher import \
-    CloudEventPublishingOptions
-from neuroglia.mapping import Mapper
 from neuroglia.mediation import Mediator
 
 from application.commands import CreateCMLWorkerCommand, CreateCMLWorkerCommandHandler
@@ -21,25 +17,57 @@ from integration.enums import AwsRegion
 from integration.models import CMLWorkerInstanceDto
 from integration.services.aws_ec2_api_client import AwsEc2Client
 
-
-@pytest.fixture
+# The provisioning handler only reads the event and the instance DTO, so both tests share them
+_WORKER_CREATED_EVENT = CMLWorkerCreatedDomainEvent(
+    aggregate_id="worker-123",
+    name="test-worker",
+    aws_region="us-east-1",
+    aws_instance_id=None,
+    instance_type="t3.medium",
+    ami_id="ami-123",
+    ami_name="Test AMI",
+    ami_description=None,
+    ami_creation_date=None,
+    status=CMLWorkerStatus.PENDING,
+    cml_version=None,
+    created_at=datetime.now(timezone.utc),
+    created_by="user",
+)
+
+_INSTANCE_DTO = CMLWorkerInstanceDto(
+    id="dto-1",
+    aws_instance_id="i-1234567890abcdef0",
+    aws_region=AwsRegion.US_EAST_1,
+    instance_name="test-worker",
+    ami_id="ami-123",
+    ami_name="Test AMI",
+    instance_type="t3.medium",
+    security_group_ids=["sg-1"],
+    subnet_id="subnet-1",
+    instance_state="running",
+    public_ip="1.2.3.4",
+    private_ip="10.0.0.1",
+)
+
+
+@pytest.fixture(scope="module")
 def mock_mediator():
     return AsyncMock(spec=Mediator)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_mapper():
-    return MagicMock(spec=Mapper)
+    return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_cloud_event_bus():
-    return AsyncMock(spec=CloudEventBus)
+    return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_cloud_event_publishing_options():
-    return MagicMock(spec=CloudEventPublishingOptions)
+    return MagicMock()
 
 
 @pytest.fixture
@@ -59,7 +87,7 @@ def mock_aws_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
     settings = MagicMock(spec=Settings)
     settings.cml_worker_ami_ids = {"us-east-1": "ami-123"}
@@ -70,13 +98,36 @@ def mock_settings():
     return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_configuration_service():
     service = AsyncMock(spec=SystemConfigurationService)
     return service
 
 
-@pytest.mark.asyncio
+# The module-scoped collaborators above are never configured per test, so they are built once per module and only
+# their call records are cleared between tests. mock_repository and mock_aws_client stay function-scoped
+# because tests give them different return values and side effects.
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(
+    mock_mediator,
+    mock_mapper,
+    mock_cloud_event_bus,
+    mock_cloud_event_publishing_options,
+    mock_settings,
+    mock_configuration_service,
+):
+    yield
+    for mock in (
+        mock_mediator,
+        mock_mapper,
+        mock_cloud_event_bus,
+        mock_cloud_event_publishing_options,
+        mock_settings,
+        mock_configuration_service,
+    ):
+        mock.reset_mock()
+
+
 class TestCreateCMLWorkerCommand:
     async def test_create_worker_command_success(
         self,
@@ -134,7 +185,6 @@ class TestCreateCMLWorkerCommand:
         mock_aws_client.get_ami_details.assert_called_once()
 
 
-@pytest.mark.asyncio
 class TestProvisionCMLWorkerEventHandler:
     async def test_provision_worker_success(
         self,
@@ -149,38 +199,8 @@ class TestProvisionCMLWorkerEventHandler:
             mock_settings,
         )
 
-        event = CMLWorkerCreatedDomainEvent(
-            aggregate_id="worker-123",
-            name="test-worker",
-            aws_region="us-east-1",
-            aws_instance_id=None,
-            instance_type="t3.medium",
-            ami_id="ami-123",
-            ami_name="Test AMI",
-            ami_description=None,
-            ami_creation_date=None,
-            status=CMLWorkerStatus.PENDING,
-            cml_version=None,
-            created_at=datetime.now(timezone.utc),
-            created_by="user",
-        )
-
         # Mock AWS response
-        instance_dto = CMLWorkerInstanceDto(
-            id="dto-1",
-            aws_instance_id="i-1234567890abcdef0",
-            aws_region=AwsRegion.US_EAST_1,
-            instance_name="test-worker",
-            ami_id="ami-123",
-            ami_name="Test AMI",
-            instance_type="t3.medium",
-            security_group_ids=["sg-1"],
-            subnet_id="subnet-1",
-            instance_state="running",
-            public_ip="1.2.3.4",
-            private_ip="10.0.0.1",
-        )
-        mock_aws_client.create_instance.return_value = instance_dto
+        mock_aws_client.create_instance.return_value = _INSTANCE_DTO
 
         # Mock repository get_by_id
         worker = MagicMock(spec=CMLWorker)
@@ -191,7 +211,7 @@ class TestProvisionCMLWorkerEventHandler:
         mock_repository.get_by_id_async.return_value = worker
 
         # Act
-        await handler.handle_async(event)
+        await handler.handle_async(_WORKER_CREATED_EVENT)
 
         # Assert
         # Verify AWS called
@@ -219,22 +239,6 @@ class TestProvisionCMLWorkerEventHandler:
             mock_settings,
         )
 
-        event = CMLWorkerCreatedDomainEvent(
-            aggregate_id="worker-123",
-            name="test-worker",
-            aws_region="us-east-1",
-            aws_instance_id=None,
-            instance_type="t3.medium",
-            ami_id="ami-123",
-            ami_name="Test AMI",
-            ami_description=None,
-            ami_creation_date=None,
-            status=CMLWorkerStatus.PENDING,
-            cml_version=None,
-            created_at=datetime.now(timezone.utc),
-            created_by="user",
-        )
-
         # Mock AWS failure
         mock_aws_client.create_instance.side_effect = Exception("AWS Error")
 
@@ -244,7 +248,7 @@ class TestProvisionCMLWorkerEventHandler:
         mock_repository.get_by_id_async.return_value = worker
 
         # Act
-        await handler.handle_async(event)
+        await handler.handle_async(_WORKER_CREATED_EVENT)
 
         # Assert
         # Verify AWS called
@@ -0,0 +1,104 @@
+"""Tests for DownloadLabCommand handler."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.commands import DownloadLabCommand, DownloadLabCommandHandler
+from application.settings import Settings
+from domain.repositories.cml_worker_repository import CMLWorkerRepository
+from integration.exceptions import IntegrationException
+from integration.services.cml_api_client import CMLApiClientFactory
+
+
+class _FakeLabStream:
+    """Stand-in for CMLApiClient.download_lab_stream that records how far it was consumed."""
+
+    def __init__(self, chunks: list[bytes], error: Exception | None = None):
+        self.chunks = chunks
+        self.error = error
+        self.closed = False
+
+    async def __call__(self, lab_id: str):
+        try:
+            for chunk in self.chunks:
+                yield chunk
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def mock_repository():
+    repository = AsyncMock(spec=CMLWorkerRepository)
+    worker = MagicMock()
+    worker.state.https_endpoint = "https://1.2.3.4"
+    worker.get_effective_endpoint.return_value = "https://1.2.3.4"
+    repository.get_by_id_async.return_value = worker
+    return repository
+
+
+@pytest.fixture
+def cml_client():
+    return MagicMock()
+
+
+@pytest.fixture
+def handler(mock_repository, cml_client):
+    factory = MagicMock(spec=CMLApiClientFactory)
+    factory.create.return_value = cml_client
+    settings = MagicMock(spec=Settings)
+    settings.use_private_ip_for_monitoring = False
+    return DownloadLabCommandHandler(mock_repository, factory, settings)
+
+
+@pytest.mark.command
+class TestDownloadLabCommand:
+    """Tests for DownloadLabCommand."""
+
+    async def test_download_returns_yaml_string(self, handler, cml_client):
+        cml_client.download_lab = AsyncMock(return_value="lab: {}\n")
+
+        result = await handler.handle_async(DownloadLabCommand(worker_id="worker-1", lab_id="lab-1"))
+
+        assert result.is_success
+        assert result.data == "lab: {}\n"
+
+    async def test_stream_yields_all_chunks_and_closes_source(self, handler, cml_client):
+        source = _FakeLabStream([b"lab:\n", b"  title: demo\n"])
+        cml_client.download_lab_stream = source
+
+        result = await handler.handle_async(DownloadLabCommand(worker_id="worker-1", lab_id="lab-1", stream=True))
+
+        assert result.is_success
+        assert b"".join([chunk async for chunk in result.data]) == b"lab:\n  title: demo\n"
+        assert source.closed
+
+    async def test_stream_error_before_first_chunk_is_a_failed_result(self, handler, cml_client):
+        source = _FakeLabStream([], error=IntegrationException("Failed to download lab: HTTP 404"))
+        cml_client.download_lab_stream = source
+
+        result = await handler.handle_async(DownloadLabCommand(worker_id="worker-1", lab_id="lab-1", stream=True))
+
+        assert not result.is_success
+        assert result.status_code == 500
+        assert source.closed
+
+    async def test_stream_error_after_first_chunk_propagates(self, handler, cml_client):
+        cml_client.download_lab_stream = _FakeLabStream([b"lab:\n"], error=IntegrationException("connection lost"))
+
+        result = await handler.handle_async(DownloadLabCommand(worker_id="worker-1", lab_id="lab-1", stream=True))
+
+        assert await anext(result.data) == b"lab:\n"
+        with pytest.raises(IntegrationException):
+            await anext(result.data)
+
+    async def test_closing_unconsumed_stream_closes_source(self, handler, cml_client):
+        source = _FakeLabStream([b"first", b"second"])
+        cml_client.download_lab_stream = source
+
+        result = await handler.handle_async(DownloadLabCommand(worker_id="worker-1", lab_id="lab-1", stream=True))
+        await result.data.aclose()
+
+        assert source.closed
@@ -0,0 +1,108 @@
+"""Tests for the Enable/DisableIdleDetection command handlers."""
+
+import copy
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.commands import (
+    DisableIdleDetectionCommand,
+    DisableIdleDetectionCommandHandler,
+    EnableIdleDetectionCommand,
+    EnableIdleDetectionCommandHandler,
+)
+from domain.entities.cml_worker import CMLWorker
+from domain.repositories.cml_worker_repository import CMLWorkerRepository
+
+_WORKER_TEMPLATE = CMLWorker(name="test-worker", aws_region="us-east-1", instance_type="t3.medium")
+
+
+@pytest.fixture
+def mock_repository():
+    """Create a mock CML Worker repository."""
+    return AsyncMock(spec=CMLWorkerRepository)
+
+
+@pytest.fixture
+def worker():
+    """Provide a fresh worker with idle detection disabled."""
+    worker = copy.deepcopy(_WORKER_TEMPLATE)
+    worker.state.is_idle_detection_enabled = False
+    return worker
+
+
+@pytest.mark.command
+class TestEnableIdleDetectionCommand:
+    """Tests for EnableIdleDetectionCommand."""
+
+    async def test_enable_idle_detection(self, mock_repository, worker):
+        mock_repository.get_by_id_async.return_value = worker
+        handler = EnableIdleDetectionCommandHandler(mock_repository)
+
+        result = await handler.handle_async(EnableIdleDetectionCommand(worker_id=worker.id(), enabled_by="admin"))
+
+        assert result.status_code == 200
+        assert result.data["message"] == "Idle detection enabled successfully"
+        assert worker.state.is_idle_detection_enabled is True
+        mock_repository.update_async.assert_called_once_with(worker)
+
+    async def test_enable_when_already_enabled_does_not_update(self, mock_repository, worker):
+        worker.state.is_idle_detection_enabled = True
+        mock_repository.get_by_id_async.return_value = worker
+        handler = EnableIdleDetectionCommandHandler(mock_repository)
+
+        result = await handler.handle_async(EnableIdleDetectionCommand(worker_id=worker.id()))
+
+        assert result.status_code == 200
+        assert result.data["message"] == "Idle detection already enabled"
+        mock_repository.update_async.assert_not_called()
+
+    async def test_enable_always_reads_current_worker_state(self, mock_repository, worker):
+        """Repeated requests reload the worker, so changes made elsewhere and deletions are seen."""
+        worker.state.is_idle_detection_enabled = True
+        mock_repository.get_by_id_async.return_value = worker
+        handler = EnableIdleDetectionCommandHandler(mock_repository)
+        command = EnableIdleDetectionCommand(worker_id=worker.id())
+
+        assert (await handler.handle_async(command)).status_code == 200
+
+        # Worker deleted by another process
+        mock_repository.get_by_id_async.return_value = None
+        result = await handler.handle_async(command)
+
+        assert result.status_code == 404
+        assert mock_repository.get_by_id_async.call_count == 2
+
+    async def test_enable_worker_not_found(self, mock_repository):
+        mock_repository.get_by_id_async.return_value = None
+        handler = EnableIdleDetectionCommandHandler(mock_repository)
+
+        result = await handler.handle_async(EnableIdleDetectionCommand(worker_id="missing"))
+
+        assert result.status_code == 404
+        mock_repository.update_async.assert_not_called()
+
+
+@pytest.mark.command
+class TestDisableIdleDetectionCommand:
+    """Tests for DisableIdleDetectionCommand."""
+
+    async def test_disable_idle_detection(self, mock_repository, worker):
+        worker.state.is_idle_detection_enabled = True
+        mock_repository.get_by_id_async.return_value = worker
+        handler = DisableIdleDetectionCommandHandler(mock_repository)
+
+        result = await handler.handle_async(DisableIdleDetectionCommand(worker_id=worker.id(), disabled_by="admin"))
+
+        assert result.status_code == 200
+        assert worker.state.is_idle_detection_enabled is False
+        mock_repository.update_async.assert_called_once_with(worker)
+
+    async def test_disable_worker_not_found(self, mock_repository):
+        mock_repository.get_by_id_async.return_value = None
+        handler = DisableIdleDetectionCommandHandler(mock_repository)
+
+        result = await handler.handle_async(DisableIdleDetectionCommand(worker_id="missing"))
+
+        assert result.status_code == 404
+        mock_repository.update_async.assert_not_called()
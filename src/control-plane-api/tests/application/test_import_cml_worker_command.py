@@ -1,5 +1,6 @@
 """Unit tests for ImportCMLWorkerCommand and handler."""
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock
 
@@ -8,7 +9,7 @@ import pytest
 from application.commands import ImportCMLWorkerCommand, ImportCMLWorkerCommandHandler
 from domain.entities.cml_worker import CMLWorker
 from domain.enums import CMLWorkerStatus
-from integration.services.aws_ec2_api_client import Ec2InstanceDescriptor
+from integration.services.aws_ec2_api_client import AmiDetails, Ec2InstanceDescriptor
 
 
 @pytest.fixture
@@ -146,6 +147,24 @@ class TestImportCMLWorkerCommandHandler:
         assert not result.is_success
         assert "at least one of" in result.detail.lower()
 
+    @pytest.mark.asyncio
+    async def test_import_fails_with_invalid_region(self, mock_dependencies):
+        """Test import rejects an unknown AWS region before calling AWS."""
+        # Arrange
+        handler = ImportCMLWorkerCommandHandler(**mock_dependencies)
+        command = ImportCMLWorkerCommand(
+            aws_region="mars-north-1",
+            aws_instance_id="i-0abcdef1234567890",
+        )
+
+        # Act
+        result = await handler.handle_async(command)
+
+        # Assert
+        assert not result.is_success
+        assert "invalid aws region" in result.detail.lower()
+        mock_dependencies["aws_ec2_client"].get_instance_details.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_import_fails_when_instance_not_found(self, mock_dependencies):
         """Test import fails when instance doesn't exist in AWS."""
@@ -193,6 +212,78 @@ class TestImportCMLWorkerCommandHandler:
         assert not result.is_success
         assert "already registered" in result.detail.lower()
 
+    @pytest.mark.asyncio
+    async def test_import_already_registered_waits_for_cancelled_ami_lookup(
+        self, mock_dependencies, sample_instance_descriptor
+    ):
+        """The background AMI lookup is cancelled and awaited on the duplicate path, not left running."""
+        handler = ImportCMLWorkerCommandHandler(**mock_dependencies)
+        command = ImportCMLWorkerCommand(aws_region="us-east-1", aws_instance_id="i-0abcdef1234567890")
+        mock_dependencies["aws_ec2_client"].get_instance_details.return_value = sample_instance_descriptor
+
+        lookup_finished = False
+
+        async def get_ami_details(**kwargs):
+            nonlocal lookup_finished
+            try:
+                await asyncio.Event().wait()  # Never completes on its own
+            finally:
+                lookup_finished = True
+
+        mock_dependencies["aws_ec2_client"].get_ami_details = get_ami_details
+
+        existing_worker = Mock()
+        existing_worker.id.return_value = "existing-worker-id"
+
+        async def get_by_aws_instance_id_async(instance_id):
+            # Let the AMI lookup task start before the duplicate is reported
+            await asyncio.sleep(0)
+            return existing_worker
+
+        mock_dependencies["cml_worker_repository"].get_by_aws_instance_id_async = get_by_aws_instance_id_async
+
+        result = await handler.handle_async(command)
+
+        assert "already registered" in result.detail.lower()
+        assert lookup_finished
+
+    @pytest.mark.asyncio
+    async def test_import_already_registered_propagates_own_cancellation(
+        self, mock_dependencies, sample_instance_descriptor
+    ):
+        """Cancelling the handler while it waits for the discarded AMI lookup cancels the handler too."""
+        handler = ImportCMLWorkerCommandHandler(**mock_dependencies)
+        command = ImportCMLWorkerCommand(aws_region="us-east-1", aws_instance_id="i-0abcdef1234567890")
+        mock_dependencies["aws_ec2_client"].get_instance_details.return_value = sample_instance_descriptor
+
+        lookup_cancelled = asyncio.Event()
+
+        async def get_ami_details(**kwargs):
+            try:
+                await asyncio.Event().wait()  # Never completes on its own
+            finally:
+                # Keep the handler waiting in the discard until the test cancels it
+                lookup_cancelled.set()
+                await asyncio.Event().wait()
+
+        mock_dependencies["aws_ec2_client"].get_ami_details = get_ami_details
+
+        existing_worker = Mock()
+        existing_worker.id.return_value = "existing-worker-id"
+
+        async def get_by_aws_instance_id_async(instance_id):
+            await asyncio.sleep(0)
+            return existing_worker
+
+        mock_dependencies["cml_worker_repository"].get_by_aws_instance_id_async = get_by_aws_instance_id_async
+
+        handler_task = asyncio.create_task(handler.handle_async(command))
+        await lookup_cancelled.wait()
+        handler_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await handler_task
+
     @pytest.mark.asyncio
     async def test_import_by_ami_id_success(self, mock_dependencies, sample_instance_descriptor):
         """Test successful import by AMI ID."""
@@ -229,6 +320,45 @@ class TestImportCMLWorkerCommandHandler:
         assert "image_ids" in call_args[1]
         assert "ami-0c55b159cbfafe1f0" in call_args[1]["image_ids"]
 
+    @pytest.mark.asyncio
+    async def test_import_by_ami_name_reuses_resolved_ami_details(self, mock_dependencies, sample_instance_descriptor):
+        """Test import by AMI name reuses the AMI details from name resolution."""
+        # Arrange
+        handler = ImportCMLWorkerCommandHandler(**mock_dependencies)
+        command = ImportCMLWorkerCommand(
+            aws_region="us-east-1",
+            ami_name="cml-worker-ami",
+        )
+
+        # Mock AWS client to resolve the AMI name and return list of instances
+        mock_dependencies["aws_ec2_client"].get_amis_by_name.return_value = [
+            AmiDetails(
+                ami_id="ami-0c55b159cbfafe1f0",
+                ami_name="cml-worker-ami-2.7.0",
+                ami_description="CML 2.7.0",
+                ami_creation_date="2024-01-15T10:30:00.000Z",
+            )
+        ]
+        mock_dependencies["aws_ec2_client"].list_instances.return_value = [sample_instance_descriptor]
+
+        # Mock repository to return no existing worker
+        mock_dependencies["cml_worker_repository"].get_by_aws_instance_id_async = AsyncMock(return_value=None)
+
+        # Mock repository add
+        mock_worker = Mock()
+        mock_worker.id.return_value = "test-worker-id"
+        mock_dependencies["cml_worker_repository"].add_async = AsyncMock(return_value=mock_worker)
+
+        # Act
+        result = await handler.handle_async(command)
+
+        # Assert
+        assert result.is_success
+        assert result.data.ami_name == "cml-worker-ami-2.7.0"
+        call_args = mock_dependencies["aws_ec2_client"].list_instances.call_args
+        assert call_args[1]["image_ids"] == ["ami-0c55b159cbfafe1f0"]
+        mock_dependencies["aws_ec2_client"].get_ami_details.assert_not_called()
+
 
 class TestCMLWorkerImportFromExisting:
     """Tests for CMLWorker.import_from_existing_instance factory method."""
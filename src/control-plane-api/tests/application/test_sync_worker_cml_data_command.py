@@ -1,23 +1,36 @@
 """Tests for SyncWorkerCMLDataCommand handler."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
-from neuroglia.eventing.cloud_events.infrastructure import CloudEventBus
-from neuroglia.mapping import Mapper
-from neuroglia.mediation import Mediator
 
 from application.commands import (SyncWorkerCMLDataCommand,
                                   SyncWorkerCMLDataCommandHandler)
-from application.services.cml_health_service import CMLHealthResult, CMLHealthService
+from application.services.cml_health_service import CMLHealthService
 from application.settings import Settings
-from domain.entities.cml_worker import CMLWorker
 from domain.enums import CMLServiceStatus, CMLWorkerStatus
 from domain.repositories.cml_worker_repository import CMLWorkerRepository
-from integration.services.cml_api_client import CMLSystemStats
+from tests.fixtures.factories import CML_WORKER_SPEC, CMLHealthFactory
 from tests.fixtures.mixins import BaseTestCase
 
 
+def _resolved(value: Any) -> MagicMock:
+    """Mock an async method with an already-completed future (cheaper to await than an AsyncMock).
+
+    Must be called from within a running test; calls are still recorded for assert_called_* checks.
+    """
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return MagicMock(return_value=future)
+
+
+# Stand-in for the handler dependencies these code paths never touch; any access fails loudly
+_UNUSED = SimpleNamespace()
+
+
 class TestSyncWorkerCMLDataCommand(BaseTestCase):
     """Test SyncWorkerCMLDataCommand handler."""
 
@@ -48,16 +61,15 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
     ) -> SyncWorkerCMLDataCommandHandler:
         """Create handler with mocked dependencies."""
         return SyncWorkerCMLDataCommandHandler(
-            mediator=MagicMock(spec=Mediator),
-            mapper=MagicMock(spec=Mapper),
-            cloud_event_bus=MagicMock(spec=CloudEventBus),
-            cloud_event_publishing_options=MagicMock(),
+            mediator=_UNUSED,
+            mapper=_UNUSED,
+            cloud_event_bus=_UNUSED,
+            cloud_event_publishing_options=_UNUSED,
             cml_worker_repository=mock_cml_worker_repository,
             cml_health_service=mock_cml_health_service,
             settings=mock_settings,
         )
 
-    @pytest.mark.asyncio
     async def test_sync_success_healthy(
         self,
         handler: SyncWorkerCMLDataCommandHandler,
@@ -70,7 +82,7 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
         command = SyncWorkerCMLDataCommand(worker_id=worker_id)
 
         # Mock worker
-        worker = MagicMock(spec=CMLWorker)
+        worker = MagicMock(spec=CML_WORKER_SPEC)
         worker.state = MagicMock()
         worker.state.status = CMLWorkerStatus.RUNNING
         worker.state.https_endpoint = "https://1.2.3.4"
@@ -81,37 +93,12 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
         worker.state.metrics.ready = True
         worker.state.metrics.labs_count = 5
 
-        mock_cml_worker_repository.get_by_id_async = AsyncMock(return_value=worker)
-        mock_cml_worker_repository.update_async = AsyncMock()
+        mock_cml_worker_repository.get_by_id_async = _resolved(worker)
+        mock_cml_worker_repository.update_async = _resolved(None)
 
         # Mock health service result
-        health_result = CMLHealthResult(
-            is_accessible=True,
-            is_healthy=True,
-            version="2.7.0",
-            ready=True,
-            system_stats=CMLSystemStats(
-                computes={"node1": "ok"},
-                all_cpu_count=10,
-                all_cpu_percent=10.0,
-                all_memory_total=1000,
-                all_memory_free=500,
-                all_memory_used=500,
-                all_disk_total=1000,
-                all_disk_free=500,
-                all_disk_used=500,
-                controller_disk_total=1000,
-                controller_disk_free=500,
-                controller_disk_used=500,
-                allocated_cpus=0,
-                allocated_memory=0,
-                total_nodes=0,
-                running_nodes=10,
-            ),
-            system_health=MagicMock(valid=True, is_licensed=True, is_enterprise=True, computes={}, controller={}),
-            license_info={"status": "Registered"},
-        )
-        mock_cml_health_service.check_health = AsyncMock(return_value=health_result)
+        health_result = CMLHealthFactory.create_healthy()
+        mock_cml_health_service.check_health = _resolved(health_result)
 
         # Act
         result = await handler.handle_async(command)
@@ -138,7 +125,6 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
         assert data["cml_data_synced"] is True
         assert data["cml_version"] == "2.6.0"  # From worker state (mocked)
 
-    @pytest.mark.asyncio
     async def test_sync_worker_not_found(
         self,
         handler: SyncWorkerCMLDataCommandHandler,
@@ -146,7 +132,7 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
     ) -> None:
         """Test sync when worker is not found."""
         # Arrange
-        mock_cml_worker_repository.get_by_id_async = AsyncMock(return_value=None)
+        mock_cml_worker_repository.get_by_id_async = _resolved(None)
         command = SyncWorkerCMLDataCommand(worker_id="missing")
 
         # Act
@@ -156,7 +142,6 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
         assert not result.is_success
         assert result.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_sync_worker_not_running(
         self,
         handler: SyncWorkerCMLDataCommandHandler,
@@ -164,10 +149,10 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
     ) -> None:
         """Test sync when worker is not running."""
         # Arrange
-        worker = MagicMock(spec=CMLWorker)
+        worker = MagicMock(spec=CML_WORKER_SPEC)
         worker.state = MagicMock()
         worker.state.status = CMLWorkerStatus.STOPPED
-        mock_cml_worker_repository.get_by_id_async = AsyncMock(return_value=worker)
+        mock_cml_worker_repository.get_by_id_async = _resolved(worker)
 
         command = SyncWorkerCMLDataCommand(worker_id="stopped")
 
@@ -179,7 +164,6 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
         assert result.data["cml_data_synced"] is False
         assert result.data["reason"] == "Worker not running"
 
-    @pytest.mark.asyncio
     async def test_sync_service_unavailable(
         self,
         handler: SyncWorkerCMLDataCommandHandler,
@@ -188,16 +172,16 @@ class TestSyncWorkerCMLDataCommand(BaseTestCase):
     ) -> None:
         """Test sync when CML service is unavailable."""
         # Arrange
-        worker = MagicMock(spec=CMLWorker)
+        worker = MagicMock(spec=CML_WORKER_SPEC)
         worker.state = MagicMock()
         worker.state.status = CMLWorkerStatus.RUNNING
         worker.state.https_endpoint = "https://1.2.3.4"
-        mock_cml_worker_repository.get_by_id_async = AsyncMock(return_value=worker)
-        mock_cml_worker_repository.update_async = AsyncMock()
+        mock_cml_worker_repository.get_by_id_async = _resolved(worker)
+        mock_cml_worker_repository.update_async = _resolved(None)
 
         # Mock health service result (inaccessible)
-        health_result = CMLHealthResult(is_accessible=False, errors={"system_info": "Connection refused"})
-        mock_cml_health_service.check_health = AsyncMock(return_value=health_result)
+        health_result = CMLHealthFactory.create_inaccessible()
+        mock_cml_health_service.check_health = _resolved(health_result)
 
         command = SyncWorkerCMLDataCommand(worker_id="worker-123")
 
@@ -11,6 +11,7 @@ import asyncio
 import os
 import sys
 from collections.abc import AsyncGenerator, Generator
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -20,6 +21,12 @@ from _pytest.config import Config
 from motor.core import AgnosticDatabase
 from motor.motor_asyncio import AsyncIOMotorClient
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the default asyncio loop
+    uvloop = None
+
 # Add src to Python path for imports
 src_path: Path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
@@ -53,11 +60,11 @@ def pytest_configure(config: Config) -> None:
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for the test session."""
-    loop: asyncio.AbstractEventLoop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop, as the background worker does, when it is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 # ============================================================================
@@ -149,6 +156,20 @@ def test_settings() -> Any:
     return app_settings
 
 
+# ============================================================================
+# TIME FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def now_utc() -> datetime:
+    """Provide one timezone-aware "now" shared by the tests of a module.
+
+    Tests offset their timestamps from it by whole minutes, so the few seconds a module takes to run do not matter.
+    """
+    return datetime.now(timezone.utc)
+
+
 # ============================================================================
 # CLEANUP FIXTURES
 # ============================================================================
@@ -1,6 +1,8 @@
 """Tests for CMLWorker Aggregate."""
 
-from datetime import datetime, timezone
+import copy
+
+import pytest
 
 from domain.entities.cml_worker import CMLWorker
 from domain.enums import CMLWorkerStatus, LicenseStatus
@@ -11,10 +13,16 @@ from domain.value_objects.cml_metrics import CMLMetrics, CMLSystemInfo
 class TestCMLWorker:
     """Test CMLWorker aggregate."""
 
-    def test_initialization(self):
-        """Test worker initialization with default values."""
-        worker = CMLWorker(name="test-worker", aws_region="us-east-1", instance_type="t3.medium")
+    # Built once; every test mutates its own deep copy instead of re-running the aggregate's initialization
+    _TEMPLATE = CMLWorker(name="test-worker", aws_region="us-east-1", instance_type="t3.medium")
+
+    @pytest.fixture
+    def worker(self) -> CMLWorker:
+        """Provide a fresh PENDING worker."""
+        return copy.deepcopy(self._TEMPLATE)
 
+    def test_initialization(self, worker):
+        """Test worker initialization with default values."""
         assert worker.state.name == "test-worker"
         assert worker.state.status == CMLWorkerStatus.PENDING
         assert isinstance(worker.state.metrics, CMLMetrics)
@@ -22,10 +30,8 @@ class TestCMLWorker:
         assert worker.state.metrics.labs_count == 0
         assert worker.state.license.status == LicenseStatus.UNREGISTERED
 
-    def test_update_cml_metrics(self):
+    def test_update_cml_metrics(self, worker):
         """Test updating CML metrics."""
-        worker = CMLWorker(name="test-worker", aws_region="us-east-1", instance_type="t3.medium")
-
         system_info = {"running_nodes": 5, "total_nodes": 10}
         system_health = {"valid": True}
         license_info = {"registration_status": "COMPLETED"}
@@ -50,19 +56,15 @@ class TestCMLWorker:
         # Check license status update side-effect
         assert worker.state.license.status == LicenseStatus.REGISTERED
 
-    def test_update_license(self):
+    def test_update_license(self, worker):
         """Test updating license directly."""
-        worker = CMLWorker(name="test-worker", aws_region="us-east-1", instance_type="t3.medium")
-
         worker.update_license(license_status=LicenseStatus.REGISTERED, license_token="token-123")
 
         assert worker.state.license.status == LicenseStatus.REGISTERED
         assert worker.state.license.token == "token-123"
 
-    def test_is_idle_logic(self):
+    def test_is_idle_logic(self, worker, now_utc):
         """Test idle detection logic using new metrics structure."""
-        worker = CMLWorker(name="test-worker", aws_region="us-east-1", instance_type="t3.medium")
-
         # No activity yet
         assert worker.is_idle(idle_threshold_minutes=30) is False
 
@@ -75,7 +77,7 @@ class TestCMLWorker:
             ready=True,
             uptime_seconds=100,
             labs_count=1,  # Active labs
-            synced_at=datetime.now(timezone.utc),
+            synced_at=now_utc,
         )
 
         assert worker.is_idle(idle_threshold_minutes=30) is False
@@ -89,7 +91,7 @@ class TestCMLWorker:
             ready=True,
             uptime_seconds=200,
             labs_count=0,  # No labs
-            synced_at=datetime.now(timezone.utc),
+            synced_at=now_utc,
         )
 
         assert worker.is_idle(idle_threshold_minutes=30) is False
@@ -97,7 +99,7 @@ class TestCMLWorker:
         # Simulate old sync time (idle)
         # We need to manually set the state because update_cml_metrics uses current time if not provided,
         # or we can pass an old time.
-        old_time = datetime.now(timezone.utc).replace(year=2020)
+        old_time = now_utc.replace(year=2020)
 
         # We can't easily inject old time via update_cml_metrics because it might filter out if no change?
         # But we can force it.
@@ -113,3 +115,25 @@ class TestCMLWorker:
         )
 
         assert worker.is_idle(idle_threshold_minutes=30) is True
+
+    def test_update_cml_metrics_threshold_suppression(self, worker):
+        """Unchanged metrics under the threshold are suppressed; a labs change always emits."""
+        system_info = {"all_cpu_percent": 10.0, "running_nodes": 1, "total_nodes": 2}
+        metrics_kwargs = dict(
+            cml_version="2.7.0",
+            system_info=system_info,
+            system_health={},
+            license_info={},
+            ready=True,
+            uptime_seconds=100,
+            change_threshold_percent=5.0,
+        )
+        worker.update_cml_metrics(labs_count=1, **metrics_kwargs)
+        events_before = len(worker.domain_events)
+
+        worker.update_cml_metrics(labs_count=1, **metrics_kwargs)
+        assert len(worker.domain_events) == events_before
+
+        worker.update_cml_metrics(labs_count=2, **metrics_kwargs)
+        assert len(worker.domain_events) == events_before + 1
+        assert worker.state.metrics.labs_count == 2
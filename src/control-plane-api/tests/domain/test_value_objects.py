@@ -4,7 +4,7 @@ from datetime import date, datetime
 
 from domain.enums import LicenseStatus
 from domain.value_objects.cml_license import CMLLicense
-from domain.value_objects.cml_metrics import CMLMetrics
+from domain.value_objects.cml_metrics import CMLMetrics, CMLSystemInfo, direct_utilization
 
 
 def test_cml_metrics_defaults():
@@ -108,3 +108,20 @@ def test_cml_metrics_utilization_calculation():
     assert mem is None
     assert storage is None
     assert storage is None
+
+
+def test_cml_metrics_get_utilization_is_memoized():
+    """Test get_utilization caches its result without changing equality or serialized fields."""
+    metrics = CMLMetrics(system_info=CMLSystemInfo(cpu_utilization=12.5, memory_total=200, memory_used=50))
+
+    first = metrics.get_utilization()
+    assert first == (12.5, 25.0, None)
+    assert metrics.get_utilization() is first
+    assert metrics == CMLMetrics(system_info=CMLSystemInfo(cpu_utilization=12.5, memory_total=200, memory_used=50))
+
+
+def test_direct_utilization():
+    """Test utilization from the aggregate system_info fields, shared by CMLMetrics and CMLWorker."""
+    assert direct_utilization(10.0, 200, 50, 1000, 250) == (10.0, 25.0, 25.0)
+    assert direct_utilization(None, 200, 50, 0, 0) == (None, 25.0, None)
+    assert direct_utilization(None, None, None, 0, 100) is None
@@ -4,12 +4,16 @@ Provides reusable factory classes for creating test data with sensible defaults
 and easy customization.
 """
 
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import uuid4
 
+from application.services.cml_health_service import CMLHealthResult
 from domain.entities import Task
+from domain.entities.cml_worker import CMLWorker
 from domain.enums import TaskPriority, TaskStatus
+from integration.services.cml_api_client import CMLSystemHealth, CMLSystemStats
 
 # ============================================================================
 # TASK FACTORY
@@ -158,3 +162,71 @@ class SessionFactory:
         session_tokens: dict[str, str] = tokens or TokenFactory.create_tokens()
         session_user_info: dict[str, Any] = user_info or TokenFactory.create_user_info()
         return (session_tokens, session_user_info)
+
+
+# ============================================================================
+# CML HEALTH FACTORY
+# ============================================================================
+
+# Templates for a reachable, healthy CML instance; factories copy them with overrides instead of rebuilding them.
+# The copies are shallow, so tests must not mutate the dict fields in place.
+_HEALTHY_SYSTEM_STATS: CMLSystemStats = CMLSystemStats(
+    computes={"node1": "ok"},
+    all_cpu_count=10,
+    all_cpu_percent=10.0,
+    all_memory_total=1000,
+    all_memory_free=500,
+    all_memory_used=500,
+    all_disk_total=1000,
+    all_disk_free=500,
+    all_disk_used=500,
+    controller_disk_total=1000,
+    controller_disk_free=500,
+    controller_disk_used=500,
+    running_nodes=10,
+)
+
+_HEALTHY_SYSTEM_HEALTH: CMLSystemHealth = CMLSystemHealth(
+    valid=True,
+    is_licensed=True,
+    is_enterprise=True,
+    computes={},
+    controller={},
+)
+
+_HEALTHY_RESULT: CMLHealthResult = CMLHealthResult(
+    is_accessible=True,
+    is_healthy=True,
+    version="2.7.0",
+    ready=True,
+    system_health=_HEALTHY_SYSTEM_HEALTH,
+    system_stats=_HEALTHY_SYSTEM_STATS,
+    license_info={"status": "Registered"},
+)
+
+
+class CMLHealthFactory:
+    """Factory for creating CML health check results."""
+
+    @staticmethod
+    def create_system_stats(**overrides: Any) -> CMLSystemStats:
+        """Create system stats of a healthy instance, with any field overridden."""
+        return replace(_HEALTHY_SYSTEM_STATS, **overrides)
+
+    @staticmethod
+    def create_healthy(**overrides: Any) -> CMLHealthResult:
+        """Create the result of a successful health check, with any field overridden."""
+        return replace(_HEALTHY_RESULT, **overrides)
+
+    @staticmethod
+    def create_inaccessible(errors: dict[str, str] | None = None) -> CMLHealthResult:
+        """Create the result of a health check that could not reach the instance."""
+        return CMLHealthResult(is_accessible=False, errors=errors or {"system_info": "Connection refused"})
+
+
+# ============================================================================
+# CML WORKER SPEC
+# ============================================================================
+
+# Attribute names of CMLWorker, introspected once for every MagicMock(spec=...) of a worker
+CML_WORKER_SPEC = dir(CMLWorker)
@@ -0,0 +1,100 @@
+"""Infrastructure layer tests for WorkerRefreshThrottle.
+
+Tests the in-memory refresh throttle:
+- Throttling inside and after the minimum interval
+- Refresh order, expiry of old entries and max_entries eviction
+
+Every call takes an injected ``now`` (a ``time.monotonic()`` value) so the tests never sleep.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from infrastructure.services.worker_refresh_throttle import WorkerRefreshThrottle
+
+_HOUR = 3600.0
+
+
+class TestWorkerRefreshThrottle:
+    """Test WorkerRefreshThrottle implementation."""
+
+    @pytest.fixture
+    def throttle(self) -> WorkerRefreshThrottle:
+        """Provide a throttle with a 10s interval and room for three workers."""
+        return WorkerRefreshThrottle(min_interval_seconds=10, max_entries=3, max_age_hours=1)
+
+    def test_unknown_worker_can_refresh(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test a worker that was never refreshed is not throttled."""
+        assert throttle.can_refresh("worker-1", now=100.0) is True
+        assert throttle.get_time_until_next_refresh("worker-1", now=100.0) is None
+        assert throttle.get_last_refresh("worker-1") is None
+
+    def test_throttled_until_min_interval(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test refreshes are rejected before min_interval_seconds and allowed from then on."""
+        throttle.record_refresh("worker-1", now=100.0)
+
+        assert throttle.can_refresh("worker-1", now=100.0) is False
+        assert throttle.can_refresh("worker-1", now=109.9) is False
+        assert throttle.can_refresh("worker-1", now=110.0) is True
+        assert throttle.can_refresh("worker-1", now=500.0) is True
+
+    def test_get_time_until_next_refresh(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test the remaining wait shrinks with elapsed time and is None once refresh is allowed."""
+        throttle.record_refresh("worker-1", now=100.0)
+
+        assert throttle.get_time_until_next_refresh("worker-1", now=100.0) == pytest.approx(10.0)
+        assert throttle.get_time_until_next_refresh("worker-1", now=104.0) == pytest.approx(6.0)
+        assert throttle.get_time_until_next_refresh("worker-1", now=110.0) is None
+
+    def test_get_last_refresh_is_wall_clock(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test the last refresh is reported as an aware UTC datetime in the past."""
+        throttle.record_refresh("worker-1")
+
+        last_refresh = throttle.get_last_refresh("worker-1")
+
+        assert last_refresh is not None
+        assert last_refresh.tzinfo is timezone.utc
+        assert datetime.now(timezone.utc) - timedelta(seconds=5) <= last_refresh <= datetime.now(timezone.utc)
+
+    def test_record_refresh_moves_worker_to_back(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test re-recording a worker moves it behind the workers refreshed since."""
+        throttle.record_refresh("worker-1", now=100.0)
+        throttle.record_refresh("worker-2", now=101.0)
+        throttle.record_refresh("worker-1", now=102.0)
+
+        assert list(throttle._last_refresh) == ["worker-2", "worker-1"]
+
+    def test_cleanup_old_entries_pops_expired_prefix(self) -> None:
+        """Test cleanup removes only the entries older than max_age and returns how many it removed."""
+        # Records keep entries for a day, so only the explicit 1h cleanup expires anything here
+        throttle = WorkerRefreshThrottle(min_interval_seconds=10, max_age_hours=24)
+        throttle.record_refresh("worker-1", now=0.0)
+        throttle.record_refresh("worker-2", now=1.5 * _HOUR)
+        throttle.record_refresh("worker-3", now=2 * _HOUR)
+
+        removed = throttle.cleanup_old_entries(max_age_hours=1, now=2 * _HOUR + 5.0)
+
+        assert removed == 1
+        assert list(throttle._last_refresh) == ["worker-2", "worker-3"]
+        assert throttle.cleanup_old_entries(max_age_hours=1, now=2 * _HOUR + 5.0) == 0
+
+    def test_record_refresh_expires_old_entries(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test recording a refresh drops entries older than max_age_hours."""
+        throttle.record_refresh("worker-1", now=0.0)
+        throttle.record_refresh("worker-2", now=_HOUR + 1.0)
+
+        assert list(throttle._last_refresh) == ["worker-2"]
+        assert throttle.can_refresh("worker-1", now=_HOUR + 1.0) is True
+
+    def test_record_refresh_evicts_least_recently_refreshed(self, throttle: WorkerRefreshThrottle) -> None:
+        """Test recording past max_entries evicts the worker refreshed longest ago."""
+        throttle.record_refresh("worker-1", now=100.0)
+        throttle.record_refresh("worker-2", now=101.0)
+        throttle.record_refresh("worker-3", now=102.0)
+        throttle.record_refresh("worker-1", now=103.0)
+
+        throttle.record_refresh("worker-4", now=104.0)
+
+        assert list(throttle._last_refresh) == ["worker-3", "worker-1", "worker-4"]
+        assert throttle.can_refresh("worker-2", now=104.0) is True
@@ -0,0 +1,103 @@
+"""Tests for CMLApiClient lab download streaming."""
+
+import httpx
+import pytest
+
+from integration.exceptions import IntegrationException
+from integration.services.cml_api_client import CMLApiClient
+
+_BASE_URL = "https://cml.example.com"
+_DOWNLOAD_PATH = "/api/v0/labs/lab-1/download"
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    """Response body that yields fixed chunks and records whether it was closed."""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _FakeCML:
+    """httpx transport handler standing in for the CML API."""
+
+    def __init__(self, download_statuses: list[int], chunks: list[bytes]):
+        self.download_statuses = download_statuses
+        self.chunks = chunks
+        self.auth_calls = 0
+        self.download_calls = 0
+        self.streams: list[_ChunkStream] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v0/authenticate":
+            self.auth_calls += 1
+            return httpx.Response(200, json=f"token-{self.auth_calls}")
+
+        assert request.url.path == _DOWNLOAD_PATH
+        status = self.download_statuses[self.download_calls]
+        self.download_calls += 1
+        stream = _ChunkStream(self.chunks if status == 200 else [b"error"])
+        self.streams.append(stream)
+        return httpx.Response(status, stream=stream)
+
+
+def _client(fake: _FakeCML) -> CMLApiClient:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(fake), timeout=30.0)
+    return CMLApiClient(base_url=_BASE_URL, username="admin", password="secret", http_client=http_client)
+
+
+class TestDownloadLabStream:
+    """Test CMLApiClient.download_lab_stream and download_lab."""
+
+    async def test_streams_chunks(self):
+        fake = _FakeCML([200], [b"lab:\n", b"  title: demo\n"])
+
+        chunks = [chunk async for chunk in _client(fake).download_lab_stream("lab-1")]
+
+        assert b"".join(chunks) == b"lab:\n  title: demo\n"
+        assert fake.streams[0].closed
+
+    async def test_download_lab_joins_stream(self):
+        fake = _FakeCML([200], [b"lab:\n", b"  title: demo\n"])
+
+        assert await _client(fake).download_lab("lab-1") == "lab:\n  title: demo\n"
+
+    async def test_retries_once_after_401_with_new_token(self):
+        fake = _FakeCML([401, 200], [b"lab: {}\n"])
+
+        chunks = [chunk async for chunk in _client(fake).download_lab_stream("lab-1")]
+
+        assert chunks == [b"lab: {}\n"]
+        assert fake.auth_calls == 2
+        assert fake.download_calls == 2
+        assert all(stream.closed for stream in fake.streams)
+
+    async def test_second_401_raises(self):
+        fake = _FakeCML([401, 401], [])
+
+        with pytest.raises(IntegrationException, match="HTTP 401"):
+            _ = [chunk async for chunk in _client(fake).download_lab_stream("lab-1")]
+
+        assert fake.download_calls == 2
+
+    async def test_http_error_raises(self):
+        fake = _FakeCML([404], [])
+
+        with pytest.raises(IntegrationException, match="HTTP 404"):
+            await anext(_client(fake).download_lab_stream("lab-1"))
+
+    async def test_aclose_before_end_closes_upstream_response(self):
+        fake = _FakeCML([200], [b"first", b"second"])
+        stream = _client(fake).download_lab_stream("lab-1")
+
+        assert await anext(stream) == b"first"
+        await stream.aclose()
+
+        assert fake.streams[0].closed
@@ -0,0 +1,57 @@
+"""Tests for CMLApiClientFactory HTTP connection pooling."""
+
+from integration.services.cml_api_client import CMLApiClientFactory, CMLApiClientPoolHostedService
+
+
+def _factory() -> CMLApiClientFactory:
+    return CMLApiClientFactory(default_username="admin", default_password="secret", verify_ssl=False, timeout=30.0)
+
+
+class TestCMLApiClientFactoryPooling:
+    """Test that CML API clients share pooled HTTP clients keyed by (verify_ssl, timeout)."""
+
+    async def test_clients_with_same_settings_share_http_client(self):
+        factory = _factory()
+
+        first = factory.create(base_url="https://10.0.0.1")
+        second = factory.create(base_url="https://10.0.0.2", username="other")
+
+        assert first._http_client is second._http_client
+        await factory.aclose()
+
+    async def test_clients_with_different_settings_get_separate_http_clients(self):
+        factory = _factory()
+
+        default = factory.create(base_url="https://10.0.0.1")
+        verified = factory.create(base_url="https://10.0.0.1", verify_ssl=True)
+        slow = factory.create(base_url="https://10.0.0.1", timeout=60.0)
+
+        assert len({id(default._http_client), id(verified._http_client), id(slow._http_client)}) == 3
+        assert factory.create(base_url="https://10.0.0.3", verify_ssl=True)._http_client is verified._http_client
+        await factory.aclose()
+
+    async def test_aclose_closes_pooled_clients_and_next_create_reopens(self):
+        factory = _factory()
+        pooled = [
+            factory.create(base_url="https://10.0.0.1")._http_client,
+            factory.create(base_url="https://10.0.0.1", verify_ssl=True)._http_client,
+        ]
+
+        await factory.aclose()
+
+        assert all(client.is_closed for client in pooled)
+        reopened = factory.create(base_url="https://10.0.0.1")._http_client
+        assert reopened not in pooled
+        assert not reopened.is_closed
+        await factory.aclose()
+
+    async def test_hosted_service_stop_closes_pooled_clients(self):
+        factory = _factory()
+        pooled = factory.create(base_url="https://10.0.0.1")._http_client
+        hosted_service = CMLApiClientPoolHostedService(factory)
+
+        await hosted_service.start_async()
+        assert not pooled.is_closed
+
+        await hosted_service.stop_async()
+        assert pooled.is_closed